@@ -31,7 +31,7 @@
 from ert.namespace import Namespace
 from ert.run_models.multiple_data_assimilation import MultipleDataAssimilation
 from ert.services import StorageService, WebvizErt
-from ert.shared.feature_toggling import FeatureScheduler
+from ert.shared.feature_toggling import FeatureDowncastFields, FeatureScheduler
 from ert.shared.plugins.plugin_manager import ErtPluginContext, ErtPluginManager
 from ert.shared.storage.command import add_parser_options as ert_api_add_parser_options
 from ert.validation import (
@@ -266,6 +266,7 @@ def get_ert_parser(parser: Optional[ArgumentParser] = None) -> ArgumentParser:
         "--verbose", action="store_true", help="Show verbose output.", default=False
     )
     FeatureScheduler.add_to_argparse(gui_parser)
+    FeatureDowncastFields.add_to_argparse(gui_parser)
 
     # lint_parser
     lint_parser = subparsers.add_parser(
@@ -596,6 +597,7 @@ def get_ert_parser(parser: Optional[ArgumentParser] = None) -> ArgumentParser:
         cli_parser.add_argument("config", type=valid_file, help=config_help)
 
         FeatureScheduler.add_to_argparse(cli_parser)
+        FeatureDowncastFields.add_to_argparse(cli_parser)
 
     return parser
 
@@ -672,6 +674,7 @@ def main() -> None:
         root_logger.addHandler(handler)
 
     FeatureScheduler.set_value(args)
+    FeatureDowncastFields.set_value(args)
     try:
         with ErtPluginContext(logger=logging.getLogger()) as context:
             logger.info(f"Running ert with {args}")
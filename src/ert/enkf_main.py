@@ -9,6 +9,7 @@
 from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Union
 
 import numpy as np
+import xarray as xr
 from numpy.random import SeedSequence
 
 from .config import ParameterConfig
@@ -164,13 +165,21 @@ def sample_prior(
         config_node = parameter_configs[parameter]
         if config_node.forward_init:
             continue
+        datasets = []
         for realization_nr in active_realizations:
             ds = config_node.sample_or_load(
                 realization_nr,
                 random_seed=random_seed,
                 ensemble_size=ensemble.ensemble_size,
             )
-            ensemble.save_parameters(parameter, realization_nr, ds)
+            if "realizations" not in ds.dims:
+                ds = ds.expand_dims(realizations=[realization_nr])
+            datasets.append(ds)
+
+        if datasets:
+            ensemble.save_parameters_bulk(
+                parameter, xr.concat(datasets, dim="realizations")
+            )
 
     ensemble.unify_parameters()
 
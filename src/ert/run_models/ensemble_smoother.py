@@ -131,8 +131,8 @@ def run_experiment(
             runpaths=self.run_paths,
             initial_mask=(
                 prior_context.ensemble.get_realization_mask_with_parameters()
-                * prior_context.ensemble.get_realization_mask_with_responses()
-                * prior_context.ensemble.get_realization_mask_without_failure()
+                & prior_context.ensemble.get_realization_mask_with_responses()
+                & prior_context.ensemble.get_realization_mask_without_failure()
             ),
             iteration=1,
         )
@@ -14,22 +14,20 @@
     from ert.namespace import Namespace
 
 
-class FeatureScheduler:
-    _DEFAULTS = {
-        "LOCAL": True,
-        "LSF": True,
-        "SLURM": False,
-        "TORQUE": True,
-    }
-    _value: Optional[bool] = None
+class _FeatureToggle:
+    """
+    A feature that can be toggled with an --enable-/--disable- pair of
+    command line flags, or with an environment variable. The command line
+    takes precedence, and the value is None when neither is given.
+    """
 
-    @classmethod
-    def is_enabled(cls, queue_system: QueueSystem) -> bool:
-        if queue_system.name == "TORQUE":
-            return True
-        if cls._value is not None:
-            return cls._value
-        return cls._DEFAULTS[queue_system.name]
+    _env_var: str
+    _dest: str
+    _enable_flag: str
+    _enable_help: str
+    _disable_flag: str
+    _disable_help: str
+    _value: Optional[bool] = None
 
     @classmethod
     def set_value(cls, args: Namespace) -> None:
@@ -40,27 +38,27 @@ def set_value(cls, args: Namespace) -> None:
         else:
             cls._value = None
 
-    @staticmethod
-    def add_to_argparse(parser: ArgumentParser) -> None:
+    @classmethod
+    def add_to_argparse(cls, parser: ArgumentParser) -> None:
         group = parser.add_mutually_exclusive_group()
         group.add_argument(
-            "--enable-scheduler",
+            cls._enable_flag,
             action="store_true",
-            help="Enable new scheduler",
-            dest="feature_scheduler",
+            help=cls._enable_help,
+            dest=cls._dest,
             default=None,
         )
         group.add_argument(
-            "--disable-scheduler",
+            cls._disable_flag,
             action="store_false",
-            help="Disable new scheduler",
-            dest="feature_scheduler",
+            help=cls._disable_help,
+            dest=cls._dest,
             default=None,
         )
 
-    @staticmethod
-    def _get_from_env() -> Optional[bool]:
-        if (value := os.environ.get("ERT_FEATURE_SCHEDULER")) is None:
+    @classmethod
+    def _get_from_env(cls) -> Optional[bool]:
+        if (value := os.environ.get(cls._env_var)) is None:
             return None
         value = value.lower()
         if value in ("true", "1"):
@@ -73,8 +71,44 @@ def _get_from_env() -> Optional[bool]:
             "This option can only be set to 'true'/'1', 'false'/'0' or 'auto'/'default'/''"
         )
 
-    @staticmethod
-    def _get_from_args(args: Namespace) -> Optional[bool]:
-        if hasattr(args, "feature_scheduler"):
-            return args.feature_scheduler
+    @classmethod
+    def _get_from_args(cls, args: Namespace) -> Optional[bool]:
+        if hasattr(args, cls._dest):
+            return getattr(args, cls._dest)
         return None
+
+
+class FeatureScheduler(_FeatureToggle):
+    _env_var = "ERT_FEATURE_SCHEDULER"
+    _dest = "feature_scheduler"
+    _enable_flag = "--enable-scheduler"
+    _enable_help = "Enable new scheduler"
+    _disable_flag = "--disable-scheduler"
+    _disable_help = "Disable new scheduler"
+    _DEFAULTS = {
+        "LOCAL": True,
+        "LSF": True,
+        "SLURM": False,
+        "TORQUE": True,
+    }
+
+    @classmethod
+    def is_enabled(cls, queue_system: QueueSystem) -> bool:
+        if queue_system.name == "TORQUE":
+            return True
+        if cls._value is not None:
+            return cls._value
+        return cls._DEFAULTS[queue_system.name]
+
+
+class FeatureDowncastFields(_FeatureToggle):
+    _env_var = "ERT_FEATURE_DOWNCAST_FIELDS"
+    _dest = "feature_downcast_fields"
+    _enable_flag = "--enable-downcast-fields"
+    _enable_help = "Store fields and surfaces as float32 to save disk and memory"
+    _disable_flag = "--disable-downcast-fields"
+    _disable_help = "Store fields and surfaces with the precision they are given in"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls._value)
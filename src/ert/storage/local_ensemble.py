@@ -5,17 +5,22 @@
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -30,6 +35,7 @@
 
 from ert.config.gen_kw_config import GenKwConfig
 from ert.config.observations import ObservationsIndices
+from ert.shared.feature_toggling import FeatureDowncastFields
 from ert.storage.mode import BaseMode, Mode, require_write
 
 from ..config import GenDataConfig, ResponseTypes
@@ -43,6 +49,25 @@
 
 logger = logging.getLogger(__name__)
 
+# Number of combined parameter datasets an ensemble keeps loaded at a time
+_MAX_CACHED_COMBINED_DATASETS = 8
+
+
+def _downcast_fields(dataset: xr.Dataset) -> xr.Dataset:
+    """
+    Stores the values of fields and surfaces as float32 instead of float64,
+    halving what is written and later read, when the downcast fields feature
+    is enabled.
+    """
+    if not FeatureDowncastFields.is_enabled():
+        return dataset
+
+    values = dataset["values"]
+    ndim = values.ndim - ("realizations" in values.dims)
+    if ndim >= 2 and values.dtype == np.float64:
+        return dataset.assign(values=values.astype(np.float32))
+    return dataset
+
 
 class _Index(BaseModel):
     id: UUID
@@ -61,21 +86,37 @@ class _Failure(BaseModel):
 
 
 class ObservationsAndResponsesData:
-    def __init__(self, observations_and_responses: npt.NDArray[Any]) -> None:
-        self._observations_and_responses = observations_and_responses
+    def __init__(
+        self,
+        labels: npt.NDArray[Any],
+        values: npt.NDArray[np.float_],
+    ) -> None:
+        """
+        Parameters
+        ----------
+        labels : ndarray
+            Array of shape (num_obs, 2) holding the key_index and
+            name of each observation.
+        values : ndarray of float
+            Array of shape (num_obs, 2 + num_reals) holding the observed
+            value, its std and the response of each realization.
+        """
+        self._labels = labels
+        self._values = values
 
     def to_long_dataframe(self) -> pd.DataFrame:
         cols = [
-            "key_index",
-            "name",
             "OBS",
             "STD",
-            *range(self._observations_and_responses.shape[1] - 4),
+            *range(self._values.shape[1] - 2),
         ]
-        return (
-            pd.DataFrame(self._observations_and_responses, columns=cols)
-            .set_index(["name", "key_index"])
-            .astype(float)
+        return pd.DataFrame(
+            self._values,
+            columns=cols,
+            index=pd.MultiIndex.from_arrays(
+                [self._labels[:, 1], self._labels[:, 0]],
+                names=["name", "key_index"],
+            ),
         )
 
     def index(self) -> npt.NDArray[np.str_]:
@@ -83,28 +124,28 @@ def index(self) -> npt.NDArray[np.str_]:
         Extracts a ndarray with the shape (num_obs,).
         Each cell holds the observation primary key.
         """
-        return self._observations_and_responses[:, 0].astype(str)
+        return self._labels[:, 0].astype(str)
 
     def observation_keys(self) -> npt.NDArray[np.str_]:
         """
         Extracts a ndarray with the shape (num_obs,).
         Each cell holds the observation name.
         """
-        return self._observations_and_responses[:, 1].astype(str)
+        return self._labels[:, 1].astype(str)
 
     def errors(self) -> npt.NDArray[np.float_]:
         """
         Extracts a ndarray with the shape (num_obs,).
         Each cell holds the std. error of the observed value.
         """
-        return self._observations_and_responses[:, 3].astype(float)
+        return self._values[:, 1]
 
     def observations(self) -> npt.NDArray[np.float_]:
         """
         Extracts a ndarray with the shape (num_obs,).
         Each cell holds the observed value.
         """
-        return self._observations_and_responses[:, 2].astype(float)
+        return self._values[:, 0]
 
     def responses(self) -> npt.NDArray[np.float_]:
         """
@@ -112,7 +153,7 @@ def responses(self) -> npt.NDArray[np.float_]:
         Each cell holds the response value corresponding to the observation/realization
         indicated by the index.
         """
-        return self._observations_and_responses[:, 4:].astype(float)
+        return self._values[:, 2:]
 
 
 class LocalEnsemble(BaseMode):
@@ -145,16 +186,37 @@ def __init__(
         super().__init__(mode)
         self._storage = storage
         self._path = path
-        self._index = _Index.model_validate_json(
-            (path / "index.json").read_text(encoding="utf-8")
-        )
+        self._index = _Index.model_validate_json((path / "index.json").read_bytes())
         self._error_log_name = "error.json"
+        self._unified_parameter_datasets: OrderedDict[
+            str, Tuple[Tuple[int, int], xr.Dataset]
+        ] = OrderedDict()
+        # The ensemble is shared between the threads serving dark storage
+        self._unified_parameter_datasets_lock = threading.Lock()
+        self._created_realization_dirs: Set[int] = set()
+
+    @cached_property
+    def _realization_dirs(self) -> List[Path]:
+        return [
+            self._path / f"realization-{realization}"
+            for realization in range(self.ensemble_size)
+        ]
 
-        @lru_cache(maxsize=None)
-        def create_realization_dir(realization: int) -> Path:
-            return self._path / f"realization-{realization}"
+    def _realization_dir(self, realization: int) -> Path:
+        if 0 <= realization < self.ensemble_size:
+            return self._realization_dirs[realization]
+        return self._path / f"realization-{realization}"
 
-        self._realization_dir = create_realization_dir
+    def _ensure_realization_dir(self, realization: int) -> Path:
+        """
+        Returns the directory of the realization, creating it the first
+        time it is written to by this instance.
+        """
+        path = self._realization_dir(realization)
+        if realization not in self._created_realization_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_realization_dirs.add(realization)
+        return path
 
     @classmethod
     def create(
@@ -260,11 +322,9 @@ def get_realization_mask_without_parent_failure(self) -> npt.NDArray[np.bool_]:
             Boolean array where True means no parent failure.
         """
 
-        return np.array(
-            [
-                (e != RealizationStorageState.PARENT_FAILURE)
-                for e in self.get_ensemble_state()
-            ]
+        return (
+            self._get_ensemble_state_values()
+            != RealizationStorageState.PARENT_FAILURE.value
         )
 
     def get_realization_mask_without_failure(self) -> npt.NDArray[np.bool_]:
@@ -277,15 +337,23 @@ def get_realization_mask_without_failure(self) -> npt.NDArray[np.bool_]:
             Boolean array where True means no failure.
         """
 
-        return np.array(
+        return ~np.isin(
+            self._get_ensemble_state_values(),
             [
-                e
-                not in [
-                    RealizationStorageState.PARENT_FAILURE,
-                    RealizationStorageState.LOAD_FAILURE,
-                ]
-                for e in self.get_ensemble_state()
-            ]
+                RealizationStorageState.PARENT_FAILURE.value,
+                RealizationStorageState.LOAD_FAILURE.value,
+            ],
+        )
+
+    def _get_ensemble_state_values(self) -> npt.NDArray[np.int8]:
+        """
+        The values of the states returned by get_ensemble_state, as an array
+        so masks can be computed from them without a python loop.
+        """
+        return np.fromiter(
+            (state.value for state in self.get_ensemble_state()),
+            dtype=np.int8,
+            count=self.ensemble_size,
         )
 
     def get_realization_mask_with_parameters(self) -> npt.NDArray[np.bool_]:
@@ -298,11 +366,12 @@ def get_realization_mask_with_parameters(self) -> npt.NDArray[np.bool_]:
             Boolean array where True means parameters are associated.
         """
 
-        return np.array(
-            [
-                self._parameters_exist_for_realization(i)
-                for i in range(self.ensemble_size)
-            ]
+        return np.fromiter(
+            self._parameters_exist_for_realizations(
+                range(self.ensemble_size), self._scan_realization_files()
+            ),
+            dtype=np.bool_,
+            count=self.ensemble_size,
         )
 
     def get_realization_mask_with_responses(
@@ -328,13 +397,40 @@ def get_realization_mask_with_responses(
             and `False` otherwise.
         """
 
-        return np.array(
-            [
-                self._responses_exist_for_realization(i, key)
-                for i in range(self.ensemble_size)
-            ]
+        return np.fromiter(
+            self._responses_exist_for_realizations(
+                range(self.ensemble_size), self._scan_realization_files(), key
+            ),
+            dtype=np.bool_,
+            count=self.ensemble_size,
         )
 
+    def _scan_realization_files(self) -> Dict[int, FrozenSet[str]]:
+        """
+        Lists the files of every realization directory in one pass, so that
+        checking which files exist for many realizations does not take a
+        stat call per file.
+        """
+        files: Dict[int, FrozenSet[str]] = {}
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                prefix, _, realization = entry.name.partition("-")
+                if prefix != "realization" or not realization.isdigit():
+                    continue
+                if entry.is_dir():
+                    with os.scandir(entry.path) as realization_entries:
+                        files[int(realization)] = frozenset(
+                            e.name for e in realization_entries
+                        )
+        return files
+
+    def _list_realization_files(self, realization: int) -> FrozenSet[str]:
+        try:
+            with os.scandir(self._realization_dir(realization)) as entries:
+                return frozenset(entry.name for entry in entries)
+        except FileNotFoundError:
+            return frozenset()
+
     def _parameters_exist_for_realization(self, realization: int) -> bool:
         """
         Returns true if all parameters in the experiment have
@@ -350,25 +446,50 @@ def _parameters_exist_for_realization(self, realization: int) -> bool:
         exists : bool
             True if parameters exist for realization.
         """
-        if not self.experiment.parameter_configuration:
-            return True
-        path = self._realization_dir(realization)
-        return all(
-            (
-                self.has_combined_parameter_dataset(parameter)
-                and realization
-                in self._load_combined_parameter_dataset(parameter)["realizations"]
+        return next(
+            self._parameters_exist_for_realizations(
+                [realization], {realization: self._list_realization_files(realization)}
+            )
+        )
+
+    def _parameters_exist_for_realizations(
+        self,
+        realizations: Iterable[int],
+        realization_files: Dict[int, FrozenSet[str]],
+    ) -> Iterator[bool]:
+        """
+        Same as _parameters_exist_for_realization for each of the given
+        realizations, answered from the files listed by
+        _scan_realization_files.
+        """
+        parameters = list(self.experiment.parameter_configuration)
+        if not parameters:
+            return (True for _ in realizations)
+
+        # The realizations of each combined dataset are read once, instead
+        # of once for every realization
+        combined_realizations = {
+            parameter: set(
+                self._load_combined_parameter_dataset(parameter)["realizations"].values
+            )
+            for parameter in parameters
+            if self.has_combined_parameter_dataset(parameter)
+        }
+        return (
+            all(
+                realization in combined_realizations.get(parameter, ())
+                or f"{parameter}.nc" in realization_files.get(realization, ())
+                for parameter in parameters
             )
-            or (path / f"{parameter}.nc").exists()
-            for parameter in self.experiment.parameter_configuration
+            for realization in realizations
         )
 
     def has_combined_response_dataset(self, key: str) -> bool:
         ds_key = self._find_unified_dataset_for_response(key)
-        return (self._path / f"{ds_key}.nc").exists()
+        return os.path.exists(os.path.join(self._path, f"{ds_key}.nc"))
 
     def has_combined_parameter_dataset(self, key: str) -> bool:
-        return (self._path / f"{key}.nc").exists()
+        return os.path.exists(os.path.join(self._path, f"{key}.nc"))
 
     def _load_combined_response_dataset(self, key: str) -> xr.Dataset:
         ds_key = self._find_unified_dataset_for_response(key)
@@ -381,10 +502,49 @@ def _load_combined_response_dataset(self, key: str) -> xr.Dataset:
         return unified_ds
 
     def _load_combined_parameter_dataset(self, key: str) -> xr.Dataset:
-        unified_ds = xr.open_dataset(self._path / f"{key}.nc")
+        unified_ds = self._open_cached_combined_parameter_dataset(key)
+        if unified_ds is None:
+            raise FileNotFoundError(
+                f"Dataset file for group {key} not found (tried {key}.nc)"
+            )
 
         return unified_ds
 
+    def _open_cached_combined_parameter_dataset(self, key: str) -> Optional[xr.Dataset]:
+        """
+        Loads the combined dataset of a parameter group, reusing the data
+        from a previous call as long as the file has not been replaced.
+        Returns None if there is no combined dataset.
+
+        The data is loaded into memory and no file handle is kept, so a
+        dataset handed out earlier is unaffected when the file is replaced.
+        Only the most recently used datasets are kept.
+        """
+        path = self._path / f"{key}.nc"
+        with self._unified_parameter_datasets_lock:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self._unified_parameter_datasets.pop(key, None)
+                return None
+
+            file_id = (stat.st_ino, stat.st_mtime_ns)
+            cached = self._unified_parameter_datasets.get(key)
+            if cached is not None and cached[0] == file_id:
+                self._unified_parameter_datasets.move_to_end(key)
+                return cached[1]
+
+            unified_ds = xr.load_dataset(path)
+            self._unified_parameter_datasets[key] = (file_id, unified_ds)
+            self._unified_parameter_datasets.move_to_end(key)
+            while len(self._unified_parameter_datasets) > _MAX_CACHED_COMBINED_DATASETS:
+                self._unified_parameter_datasets.popitem(last=False)
+            return unified_ds
+
+    def _drop_cached_combined_parameter_dataset(self, key: str) -> None:
+        with self._unified_parameter_datasets_lock:
+            self._unified_parameter_datasets.pop(key, None)
+
     def _responses_exist_for_realization(
         self, realization: int, key: Optional[str] = None
     ) -> bool:
@@ -407,27 +567,51 @@ def _responses_exist_for_realization(
             otherwise, `False`.
         """
 
-        if not self.experiment.response_configuration:
-            return True
+        return next(
+            self._responses_exist_for_realizations(
+                [realization],
+                {realization: self._list_realization_files(realization)},
+                key,
+            )
+        )
 
-        real_dir = self._realization_dir(realization)
-        if key:
-            if self.has_combined_response_dataset(key):
-                return (
-                    realization
-                    in self._load_combined_response_dataset(key)["realization"]
-                )
-            else:
-                return (real_dir / f"{key}.nc").exists()
+    def _responses_exist_for_realizations(
+        self,
+        realizations: Iterable[int],
+        realization_files: Dict[int, FrozenSet[str]],
+        key: Optional[str] = None,
+    ) -> Iterator[bool]:
+        """
+        Same as _responses_exist_for_realization for each of the given
+        realizations, answered from the files listed by
+        _scan_realization_files.
+        """
+        response_configuration = self.experiment.response_configuration
+        if not response_configuration:
+            return (True for _ in realizations)
+
+        responses = [key] if key else list(response_configuration)
+        combined_realizations = {
+            response: set(
+                self._load_combined_response_dataset(response)["realization"].values
+            )
+            for response in responses
+            if self.has_combined_response_dataset(response)
+        }
 
-        return all(
-            (real_dir / f"{response}.nc").exists()
-            or (
-                self.has_combined_response_dataset(response)
-                and realization
-                in self._load_combined_response_dataset(response)["realization"].values
+        if key and key in combined_realizations:
+            return (
+                realization in combined_realizations[key]
+                for realization in realizations
             )
-            for response in self.experiment.response_configuration
+
+        return (
+            all(
+                f"{response}.nc" in realization_files.get(realization, ())
+                or realization in combined_realizations.get(response, ())
+                for response in responses
+            )
+            for realization in realizations
         )
 
     def is_initalized(self) -> List[int]:
@@ -442,20 +626,20 @@ def is_initalized(self) -> List[int]:
             Returns the realization numbers with parameters
         """
 
-        return list(
+        needed_files = frozenset(
+            f"{parameter.name}.nc"
+            for parameter in self.experiment.parameter_configuration.values()
+            if not parameter.forward_init
+        )
+        if all((self._path / name).exists() for name in needed_files):
+            return list(range(self.ensemble_size))
+
+        realization_files = self._scan_realization_files()
+        return [
             i
             for i in range(self.ensemble_size)
-            if all(
-                (self._realization_dir(i) / f"{parameter.name}.nc").exists()
-                for parameter in self.experiment.parameter_configuration.values()
-                if not parameter.forward_init
-            )
-            or all(
-                (self._path / f"{parameter.name}.nc").exists()
-                for parameter in self.experiment.parameter_configuration.values()
-                if not parameter.forward_init
-            )
-        )
+            if needed_files <= realization_files.get(i, frozenset())
+        ]
 
     def has_data(self) -> List[int]:
         """
@@ -466,14 +650,19 @@ def has_data(self) -> List[int]:
         exists : List[int]
             Returns the realization numbers with responses
         """
-        return list(
-            i
-            for i in range(self.ensemble_size)
-            if all(
-                self._responses_exist_for_realization(i, response_key)
-                for response_key in self.experiment.response_configuration
+        realizations = range(self.ensemble_size)
+        realization_files = self._scan_realization_files()
+        masks = [
+            np.fromiter(
+                self._responses_exist_for_realizations(
+                    realizations, realization_files, response_key
+                ),
+                dtype=np.bool_,
+                count=self.ensemble_size,
             )
-        )
+            for response_key in self.experiment.response_configuration
+        ]
+        return [i for i in realizations if all(mask[i] for mask in masks)]
 
     def realizations_initialized(self, realizations: List[int]) -> bool:
         """
@@ -490,13 +679,19 @@ def realizations_initialized(self, realizations: List[int]) -> bool:
             True if all realizations are initialized.
         """
 
-        responses = self.get_realization_mask_with_responses()
-        parameters = self.get_realization_mask_with_parameters()
-
-        if len(responses) == 0 and len(parameters) == 0:
+        if self.ensemble_size == 0:
             return False
 
-        return all((responses[real] or parameters[real]) for real in realizations)
+        # Only the requested realizations are checked, rather than building
+        # the response and parameter masks for the whole ensemble
+        files = self._scan_realization_files()
+        return all(
+            has_responses or has_parameters
+            for has_responses, has_parameters in zip(
+                self._responses_exist_for_realizations(realizations, files),
+                self._parameters_exist_for_realizations(realizations, files),
+            )
+        )
 
     def get_realization_with_responses(
         self, key: Optional[str] = None
@@ -537,8 +732,9 @@ def set_failure(
             Optional message describing the failure.
         """
 
-        filename: Path = self._realization_dir(realization) / self._error_log_name
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        filename: Path = (
+            self._ensure_realization_dir(realization) / self._error_log_name
+        )
         error = _Failure(
             type=failure_type, message=message if message else "", time=datetime.now()
         )
@@ -585,13 +781,13 @@ def get_failure(self, realization: int) -> Optional[_Failure]:
             Failure information if recorded, otherwise None.
         """
 
-        if self.has_failure(realization):
-            return _Failure.model_validate_json(
-                (self._realization_dir(realization) / self._error_log_name).read_text(
-                    encoding="utf-8"
-                )
-            )
-        return None
+        try:
+            error = (
+                self._realization_dir(realization) / self._error_log_name
+            ).read_bytes()
+        except FileNotFoundError:
+            return None
+        return _Failure.model_validate_json(error)
 
     def get_ensemble_state(self) -> List[RealizationStorageState]:
         """
@@ -603,20 +799,62 @@ def get_ensemble_state(self) -> List[RealizationStorageState]:
             List of realization states.
         """
 
+        realization_files = self._scan_realization_files()
+        with_parameters, with_responses = self._compute_realization_masks(
+            realization_files
+        )
+
         def _find_state(realization: int) -> RealizationStorageState:
-            if self.has_failure(realization):
+            if self._error_log_name in realization_files.get(realization, ()):
                 failure = self.get_failure(realization)
                 assert failure
                 return failure.type
-            if self._responses_exist_for_realization(realization):
+            if with_responses[realization]:
                 return RealizationStorageState.HAS_DATA
-            if self._parameters_exist_for_realization(realization):
+            if with_parameters[realization]:
                 return RealizationStorageState.INITIALIZED
             else:
                 return RealizationStorageState.UNDEFINED
 
         return [_find_state(i) for i in range(self.ensemble_size)]
 
+    def _compute_realization_masks(
+        self, realization_files: Optional[Dict[int, FrozenSet[str]]] = None
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """
+        Computes the masks of get_realization_mask_with_parameters and
+        get_realization_mask_with_responses from a single scan of the
+        realization directories.
+
+        Parameters
+        ----------
+        realization_files : dict of int: frozenset of str, optional
+            Files of each realization directory, as returned by
+            _scan_realization_files. Scanned if not given.
+
+        Returns
+        -------
+        masks : tuple of ndarray of bool
+            The parameter mask and the response mask.
+        """
+        if realization_files is None:
+            realization_files = self._scan_realization_files()
+        realizations = range(self.ensemble_size)
+        return (
+            np.fromiter(
+                self._parameters_exist_for_realizations(
+                    realizations, realization_files
+                ),
+                dtype=np.bool_,
+                count=self.ensemble_size,
+            ),
+            np.fromiter(
+                self._responses_exist_for_realizations(realizations, realization_files),
+                dtype=np.bool_,
+                count=self.ensemble_size,
+            ),
+        )
+
     def get_summary_keyset(self) -> List[str]:
         """
         Find the first folder with summary data then load the
@@ -679,8 +917,6 @@ def load_parameters(
         if realizations is None:
             selected_realizations = None
         elif isinstance(realizations, int):
-            assert isinstance(realizations, int)
-            drop_reals_dim = True
             selected_realizations = realizations
         elif isinstance(realizations, (np.ndarray, tuple, list)):
             selected_realizations = list(realizations)
@@ -697,7 +933,7 @@ def load_parameters(
         except (ValueError, KeyError, FileNotFoundError):
             # Fallback to check for real folder
             try:
-                if isinstance(selected_realizations, int) and drop_reals_dim:
+                if isinstance(selected_realizations, int):
                     return xr.open_dataset(
                         self._path
                         / f"realization-{selected_realizations}"
@@ -713,12 +949,6 @@ def load_parameters(
                         ],
                         concat_dim="realizations",
                     )
-                elif isinstance(selected_realizations, int):
-                    return xr.open_dataset(
-                        self._path
-                        / f"realization-{selected_realizations}"
-                        / f"{group}.nc"
-                    )
                 else:
                     assert isinstance(selected_realizations, list)
                     return xr.combine_nested(
@@ -737,19 +967,16 @@ def load_parameters(
                 ) from e
 
     def _find_unified_dataset_for_response(self, key: str) -> str:
-        all_gen_data_keys = {
-            k
-            for k, c in self.experiment.response_configuration.items()
-            if isinstance(c, GenDataConfig)
-        }
-
-        if key == ResponseTypes.gen_data or key in all_gen_data_keys:
+        response_configuration = self.experiment.response_configuration
+        if key == ResponseTypes.gen_data or isinstance(
+            response_configuration.get(key), GenDataConfig
+        ):
             return "gen_data"
 
         if key == ResponseTypes.summary or key in self.get_summary_keyset():
             return "summary"
 
-        if key not in self.experiment.response_configuration:
+        if key not in response_configuration:
             raise ValueError(f"{key} is not a response")
 
         return key
@@ -758,8 +985,10 @@ def open_unified_response_dataset(self, key: str) -> xr.Dataset:
         dataset_key = self._find_unified_dataset_for_response(key)
         nc_path = self._path / f"{dataset_key}.nc"
 
+        # Opening a missing file fails anyway, so there is no need to check
+        # that it exists first
         ds = None
-        if os.path.exists(nc_path):
+        with contextlib.suppress(FileNotFoundError):
             ds = xr.open_dataset(nc_path)
 
         if not ds:
@@ -778,7 +1007,7 @@ def open_unified_parameter_dataset(self, key: str) -> xr.Dataset:
         nc_path = self._path / f"{key}.nc"
 
         ds = None
-        if os.path.exists(nc_path):
+        with contextlib.suppress(FileNotFoundError):
             ds = xr.open_dataset(nc_path)
 
         if not ds:
@@ -957,6 +1186,9 @@ def load_all_gen_kw_data(
         ]
         if group:
             gen_kws = [config for config in gen_kws if config.name == group]
+        # The columns of each group come out sorted, so with the groups in
+        # name order the combined columns are usually sorted already
+        gen_kws.sort(key=lambda config: config.name)
         for key in gen_kws:
             with contextlib.suppress(KeyError):
                 ds = self.load_parameters(key.name)
@@ -966,22 +1198,57 @@ def load_all_gen_kw_data(
 
                 da = ds["transformed_values"]
                 assert isinstance(da, xr.DataArray)
-                da["names"] = np.char.add(f"{key.name}:", da["names"].astype(np.str_))
-                df = da.to_dataframe().pivot_table(
-                    index="realizations", columns="names", values="transformed_values"
+                if "realizations" not in da.dims:
+                    da = da.expand_dims("realizations")
+                da = da.sortby(["realizations", "names"]).transpose(
+                    "realizations", "names"
+                )
+                values = da.values
+                columns = [
+                    f"{key.name}:{name}" for name in da["names"].values.astype(np.str_)
+                ]
+                log_scale_names = {
+                    f"{key.name}:{tf.name}"
+                    for tf in key.transform_functions
+                    if tf.use_log
+                }
+                log_indices = [
+                    i for i, column in enumerate(columns) if column in log_scale_names
+                ]
+                if log_indices:
+                    # The LOG10_ columns are computed in one call and added
+                    # to the values before the DataFrame is built
+                    values = np.hstack([values, np.log10(values[:, log_indices])])
+                    columns += [f"LOG10_{columns[i]}" for i in log_indices]
+                dataframes.append(
+                    pd.DataFrame(
+                        values,
+                        index=pd.Index(da["realizations"].values, name="realizations"),
+                        columns=columns,
+                    )
                 )
-                for parameter in df.columns:
-                    if key.shouldUseLogScale(parameter.split(":")[1]):
-                        df[f"LOG10_{parameter}"] = np.log10(df[parameter])
-                dataframes.append(df)
         if not dataframes:
             return pd.DataFrame()
 
-        dataframe = pd.concat(dataframes, axis=1)
+        if len(dataframes) == 1:
+            dataframe = dataframes[0]
+        else:
+            # The groups have disjoint columns, so stack the values of each
+            # group on a shared index rather than letting pd.concat align them
+            index = dataframes[0].index
+            for df in dataframes[1:]:
+                index = index.union(df.index)
+            dataframe = pd.DataFrame(
+                np.hstack([df.reindex(index=index).to_numpy() for df in dataframes]),
+                index=index,
+                columns=np.concatenate([df.columns.to_numpy() for df in dataframes]),
+            )
         dataframe.columns.name = None
         dataframe.index.name = "Realization"
 
-        return dataframe.sort_index(axis=1)
+        if not dataframe.columns.is_monotonic_increasing:
+            dataframe = dataframe.sort_index(axis=1)
+        return dataframe
 
     def _validate_parameters_dataset(self, group: str, dataset: xr.Dataset) -> None:
         if "values" not in dataset.variables:
@@ -995,7 +1262,12 @@ def _validate_parameters_dataset(self, group: str, dataset: xr.Dataset) -> None:
                 f"Parameters {group} are empty. Cannot proceed with saving to storage."
             )
 
-        if dataset["values"].ndim >= 2 and dataset["values"].values.dtype == "float64":
+        values = dataset["values"]
+        if (
+            values.ndim - ("realizations" in values.dims) >= 2
+            and values.dtype == "float64"
+            and not FeatureDowncastFields.is_enabled()
+        ):
             logger.warning(
                 "Dataset uses 'float64' for fields/surfaces. Use 'float32' to save memory."
             )
@@ -1003,22 +1275,6 @@ def _validate_parameters_dataset(self, group: str, dataset: xr.Dataset) -> None:
         if group not in self.experiment.parameter_configuration:
             raise ValueError(f"{group} is not registered to the experiment.")
 
-    def _assert_dataset_not_already_created(
-        self, group: str, realization: Optional[int] = None
-    ) -> None:
-        path_in_base_folder = self._path / f"{group}.nc"
-        if os.path.exists(path_in_base_folder):
-            f"There already exists a combined dataset for parameter group {group}"
-            f" for group {group} @ {path_in_base_folder}. Parameters should be saved only once."
-
-        if realization is not None:
-            path_in_real_folder = self._realization_dir(realization) / f"{group}.nc"
-            if os.path.exists(path_in_real_folder):
-                raise KeyError(
-                    "Detected attempt at overwriting already saved parameter"
-                    f" for group {group} @ {path_in_real_folder}. Parameters should be saved only once."
-                )
-
     @require_write
     def save_parameters(
         self,
@@ -1043,16 +1299,70 @@ def save_parameters(
             a 1d-vector.
         """
 
-        self._assert_dataset_not_already_created(group)
         self._validate_parameters_dataset(group, dataset)
+        self._write_parameters_for_realization(group, realization, dataset)
+
+    @require_write
+    def save_parameters_batch(
+        self,
+        group: str,
+        datasets: Iterable[Tuple[int, xr.Dataset]],
+    ) -> None:
+        """
+        Saves the provided datasets under a parameter group, one per
+        realization index. Each dataset is written before the next one is
+        taken, so datasets can be a generator loading them one at a time.
+
+        Parameters
+        ----------
+        group : str
+            Parameter group name for saving datasets.
+
+        datasets : iterable of (int, Dataset)
+            Pairs of realization index and dataset to save. Each dataset
+            must contain a variable named 'values'.
+        """
 
-        path = self._realization_dir(realization) / f"{group}.nc"
-        path.parent.mkdir(exist_ok=True)
+        for realization, dataset in datasets:
+            self._validate_parameters_dataset(group, dataset)
+            self._write_parameters_for_realization(group, realization, dataset)
+
+    def _write_parameters_for_realization(
+        self, group: str, realization: int, dataset: xr.Dataset
+    ) -> None:
+        path = self._ensure_realization_dir(realization) / f"{group}.nc"
 
         if "realizations" not in dataset.dims:
             dataset = dataset.expand_dims(realizations=[realization])
 
-        dataset.to_netcdf(path, engine="scipy")
+        _downcast_fields(dataset).to_netcdf(path, engine="scipy")
+
+    @require_write
+    def save_parameters_bulk(self, group: str, dataset: xr.Dataset) -> None:
+        """
+        Saves a dataset holding several realizations of a parameter group
+        directly to the combined dataset of the group, without going through
+        one file per realization.
+
+        Parameters
+        ----------
+        group : str
+            Parameter group name for saving dataset.
+
+        dataset : Dataset
+            Dataset to save. It must contain a variable named 'values'
+            and a 'realizations' dimension.
+        """
+
+        self._validate_parameters_dataset(group, dataset)
+
+        if "realizations" not in dataset.dims:
+            raise ValueError(
+                f"Dataset for parameter group '{group}' "
+                f"must have a 'realizations' dimension"
+            )
+
+        self._write_combined_dataset(group, _downcast_fields(dataset), "realizations")
 
     @require_write
     def save_response(self, group: str, data: xr.Dataset, realization: int) -> None:
@@ -1083,26 +1393,58 @@ def save_response(self, group: str, data: xr.Dataset, realization: int) -> None:
         if "realization" not in data.dims:
             data = data.expand_dims({"realization": [realization]})
 
-        output_path = self._realization_dir(realization)
-        Path.mkdir(output_path, parents=True, exist_ok=True)
-
+        output_path = self._ensure_realization_dir(realization)
         data.to_netcdf(output_path / f"{group}.nc", engine="scipy")
 
     def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
         if not parameter_group in self.experiment.parameter_configuration:
             raise ValueError(f"{parameter_group} is not registered to the experiment.")
 
-        path_unified = self._path / f"{parameter_group}.nc"
-        if os.path.exists(path_unified):
-            return xr.open_dataset(path_unified).std("realizations")
+        unified_ds = self._open_cached_combined_parameter_dataset(parameter_group)
+        if unified_ds is not None:
+            return unified_ds.std("realizations")
+
+        paths = self._find_realization_files([parameter_group])[parameter_group]
+        if not paths:
+            raise OSError(f"No realizations found for parameter {parameter_group}")
+
+        # Welford's algorithm, reading one realization at a time so that
+        # only a single realization of the parameter is in memory at once
+        template: Optional[xr.Dataset] = None
+        count: Dict[str, npt.NDArray[np.int_]] = {}
+        mean: Dict[str, npt.NDArray[np.float64]] = {}
+        m2: Dict[str, npt.NDArray[np.float64]] = {}
+        for path in paths:
+            ds = xr.load_dataset(path).squeeze("realizations", drop=True)
+            if template is None:
+                template = ds
+                for name, var in ds.data_vars.items():
+                    if np.issubdtype(var.dtype, np.number):
+                        count[name] = np.zeros(var.shape, dtype=np.int_)
+                        mean[name] = np.zeros(var.shape, dtype=np.float64)
+                        m2[name] = np.zeros(var.shape, dtype=np.float64)
+
+            for name in mean:
+                x = ds[name].values.astype(np.float64)
+                valid = ~np.isnan(x)
+                count[name] += valid
+                delta = np.where(valid, x - mean[name], 0.0)
+                mean[name] += np.divide(
+                    delta, count[name], out=np.zeros_like(delta), where=valid
+                )
+                m2[name] += np.where(valid, delta * (x - mean[name]), 0.0)
 
-        path = self._path / "realization-*" / f"{parameter_group}.nc"
-        try:
-            ds = xr.open_mfdataset(str(path))
-        except OSError as e:
-            raise e
+        assert template is not None
+        std_dev = {}
+        for name in mean:
+            dtype = template[name].dtype
+            if not np.issubdtype(dtype, np.floating):
+                dtype = np.dtype(np.float64)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values = np.sqrt(m2[name] / count[name])
+            std_dev[name] = (template[name].dims, values.astype(dtype))
 
-        return ds.std("realizations")
+        return xr.Dataset(std_dev, coords=template.coords)
 
     def get_observations_and_responses(
         self,
@@ -1129,22 +1471,33 @@ def get_observations_and_responses(
             active_realizations: List of active realization indices
         """
 
-        long_nps = []
+        blocks: List[
+            Tuple[
+                npt.NDArray[np.str_],
+                str,
+                npt.NDArray[np.float_],
+                npt.NDArray[np.float_],
+                npt.NDArray[np.float_],
+            ]
+        ] = []
         reals_with_responses_mask = self.get_realization_with_responses()
         if active_realizations is not None:
             reals_with_responses_mask = np.intersect1d(
                 active_realizations, reals_with_responses_mask
             )
 
-        for response_type in self.experiment.observations:
-            obs_datasets = self.experiment.observations[response_type]
+        realizations_with_responses = tuple(reals_with_responses_mask)
+        for response_type, obs_datasets in self.experiment.observations.items():
             obs_names_to_check = set(obs_datasets["obs_name"].data).intersection(
                 observation_keys
             )
             responses_ds = self.load_responses(
                 response_type,
-                realizations=tuple(reals_with_responses_mask),
+                realizations=realizations_with_responses,
             )
+            # Several observations can refer to the same response, so each
+            # response is selected and read from disk only once
+            responses_by_name: Dict[str, xr.Dataset] = {}
 
             index = ObservationsIndices[ResponseTypes(response_type)]
             for obs_name in obs_names_to_check:
@@ -1161,45 +1514,38 @@ def get_observations_and_responses(
                         name=response_name, drop=True
                     )
 
-                    responses_matching_obs = responses_ds.sel(
-                        name=response_name, drop=True
-                    )
+                    if response_name not in responses_by_name:
+                        responses_by_name[response_name] = responses_ds.sel(
+                            name=response_name, drop=True
+                        ).load()
+                    responses_matching_obs = responses_by_name[response_name]
 
                     combined = observations_for_response.merge(
                         responses_matching_obs, join="left"
                     )
 
-                    response_vals_per_real = (
-                        combined["values"].stack(key=index).values.T
-                    )
+                    # Flatten the index dims in place of stacking them, which
+                    # would build a MultiIndex only to throw it away
+                    values = combined["values"].transpose("realization", *index).data
+                    response_vals_per_real = values.reshape(values.shape[0], -1).T
 
-                    key_index_1d = np.array(
-                        [
-                            (
-                                x.strftime("%Y-%m-%d")
-                                if isinstance(x, pd.Timestamp)
-                                else json.dumps(x)
-                            )
-                            for x in combined[index].coords.to_index()
-                        ]
+                    key_index_1d = self._format_key_index(
+                        combined[index].coords.to_index()
                     ).reshape(-1, 1)
                     obs_vals_1d = combined["observations"].data.reshape(-1, 1)
                     std_vals_1d = combined["std"].data.reshape(-1, 1)
 
                     num_obs_names = len(obs_vals_1d)
-                    obs_names_1d = np.full((len(std_vals_1d), 1), obs_name)
 
                     if (
                         len(key_index_1d) != num_obs_names
                         or len(response_vals_per_real) != num_obs_names
-                        or len(obs_names_1d) != num_obs_names
                         or len(std_vals_1d) != num_obs_names
                     ):
                         raise IndexError(
                             "Axis 0 misalignment, expected axis0 length to "
                             f"correspond to observation names {num_obs_names}. Got:\n"
                             f"len(response_vals_per_real)={len(response_vals_per_real)}\n"
-                            f"len(obs_names_1d)={len(obs_names_1d)}\n"
                             f"len(std_vals_1d)={len(std_vals_1d)}"
                         )
 
@@ -1214,19 +1560,17 @@ def get_observations_and_responses(
                             f"={response_vals_per_real.shape[1]}"
                         )
 
-                    combined_np_long = np.concatenate(
-                        [
+                    blocks.append(
+                        (
                             key_index_1d,
-                            obs_names_1d,
+                            obs_name,
                             obs_vals_1d,
                             std_vals_1d,
                             response_vals_per_real,
-                        ],
-                        axis=1,
+                        )
                     )
-                    long_nps.append(combined_np_long)
 
-        if not long_nps:
+        if not blocks:
             msg = (
                 "No observation: "
                 + (", ".join(observation_keys) if observation_keys is not None else "*")
@@ -1234,11 +1578,58 @@ def get_observations_and_responses(
             )
             raise KeyError(msg)
 
+        # Fill all blocks into one preallocated array of labels and one
+        # of values, rather than concatenating each block and then
+        # concatenating all of them
+        num_rows = sum(len(block[0]) for block in blocks)
+        labels = np.empty((num_rows, 2), dtype=object)
+        values = np.empty((num_rows, 2 + len(reals_with_responses_mask)))
+        row = 0
+        for key_index_1d, obs_name, obs_vals_1d, std_vals_1d, vals in blocks:
+            next_row = row + len(key_index_1d)
+            labels[row:next_row, 0:1] = key_index_1d
+            labels[row:next_row, 1] = obs_name
+            values[row:next_row, 0:1] = obs_vals_1d
+            values[row:next_row, 1:2] = std_vals_1d
+            values[row:next_row, 2:] = vals
+            row = next_row
+
         # Ensure sorting by obs_name->key_index
-        long_np = np.concatenate(long_nps)
-        sorted_long_np = long_np[np.lexsort((long_np[:, 0], long_np[:, 1]))]
+        order = np.lexsort((labels[:, 0], labels[:, 1]))
 
-        return ObservationsAndResponsesData(sorted_long_np)
+        return ObservationsAndResponsesData(labels[order], values[order])
+
+    @staticmethod
+    def _format_key_index(key_index: pd.Index) -> npt.NDArray[np.str_]:
+        """
+        Formats the index of an observation as key_index strings, i.e.
+        "%Y-%m-%d" for summary and "[index, report_step]" for gen_data.
+        """
+        if isinstance(key_index, pd.DatetimeIndex):
+            return key_index.strftime("%Y-%m-%d").to_numpy(dtype=np.str_)
+
+        if isinstance(key_index, pd.MultiIndex) and all(
+            pd.api.types.is_integer_dtype(level) for level in key_index.levels
+        ):
+            formatted = np.array("[", dtype=np.str_)
+            for i in range(key_index.nlevels):
+                if i > 0:
+                    formatted = np.char.add(formatted, ", ")
+                formatted = np.char.add(
+                    formatted, key_index.get_level_values(i).to_numpy().astype(np.str_)
+                )
+            return np.char.add(formatted, "]")
+
+        return np.array(
+            [
+                (
+                    x.strftime("%Y-%m-%d")
+                    if isinstance(x, pd.Timestamp)
+                    else json.dumps(x)
+                )
+                for x in key_index
+            ]
+        )
 
     @staticmethod
     def _ensure_correct_coordinate_order(ds: xr.Dataset) -> xr.Dataset:
@@ -1263,52 +1654,94 @@ def _ensure_correct_coordinate_order(ds: xr.Dataset) -> xr.Dataset:
             dim_order_of_first_var[0]  # "realization" / "realizations"
         )
 
-    def _unify_datasets(
+    def _write_combined_dataset(
         self,
-        groups: List[str],
+        group: str,
+        new_combined: xr.Dataset,
         concat_dim: Literal["realization", "realizations"],
-        delete_after: bool = True,
     ) -> None:
-        for group in groups:
-            combined_ds_path = self._path / f"{group}.nc"
-            has_existing_combined = os.path.exists(combined_ds_path)
-
-            paths = sorted(
-                self.mount_point.glob(f"realization-*/{glob.escape(group)}.nc")
+        """
+        Writes new_combined to the combined dataset of the group, replacing
+        any realizations that are already present in an existing combined
+        dataset.
+        """
+        combined_ds_path = self._path / f"{group}.nc"
+        if concat_dim == "realizations":
+            self._drop_cached_combined_parameter_dataset(group)
+
+        if os.path.exists(combined_ds_path):
+            # Merge new combined into old
+            old_combined = xr.load_dataset(combined_ds_path)
+            reals_to_replace = new_combined[concat_dim].data
+            reals_to_drop_from_old = set(reals_to_replace).intersection(
+                set(old_combined[concat_dim].data)
             )
 
-            if len(paths) > 0:
-                new_combined = xr.combine_nested(
-                    [xr.open_dataset(p, engine="scipy") for p in paths],
-                    concat_dim=concat_dim,
+            if reals_to_drop_from_old:
+                old_combined = old_combined.drop_sel(
+                    {concat_dim: list(reals_to_drop_from_old)}
                 )
 
-                if has_existing_combined:
-                    # Merge new combined into old
-                    old_combined = xr.open_dataset(combined_ds_path)
-                    reals_to_replace = new_combined[concat_dim].data
-                    reals_to_drop_from_old = set(reals_to_replace).intersection(
-                        set(old_combined[concat_dim].data)
-                    )
+            new_combined = old_combined.merge(new_combined)
+            os.remove(combined_ds_path)
 
-                    if reals_to_drop_from_old:
-                        old_combined = old_combined.drop_sel(
-                            {concat_dim: list(reals_to_drop_from_old)}
-                        )
+        new_combined = self._ensure_correct_coordinate_order(new_combined)
+
+        if not new_combined:
+            raise ValueError("Unified dataset somehow ended up empty")
 
-                    new_combined = old_combined.merge(new_combined)
-                    os.remove(combined_ds_path)
+        new_combined.to_netcdf(combined_ds_path, engine="scipy")
+
+    def _find_realization_files(self, groups: Iterable[str]) -> Dict[str, List[Path]]:
+        """
+        Finds the realization-*/<group>.nc files of all the given groups,
+        listing each realization directory only once.
+        """
+        files: Dict[str, List[Path]] = {group: [] for group in groups}
+        for realization, names in self._scan_realization_files().items():
+            for group, paths in files.items():
+                if f"{group}.nc" in names:
+                    paths.append(self._realization_dir(realization) / f"{group}.nc")
+
+        return {group: sorted(paths) for group, paths in files.items()}
+
+    def _unify_datasets(
+        self,
+        groups: List[str],
+        concat_dim: Literal["realization", "realizations"],
+        delete_after: bool = True,
+    ) -> None:
+        files_by_group = self._find_realization_files(groups)
+        for group in groups:
+            paths = files_by_group[group]
 
-                new_combined = self._ensure_correct_coordinate_order(new_combined)
+            if not paths:
+                continue
 
-                if not new_combined:
-                    raise ValueError("Unified dataset somehow ended up empty")
+            if len(paths) == 1:
+                with xr.open_dataset(paths[0], engine="scipy") as ds:
+                    new_combined = ds.load()
+            else:
+                # The realizations share everything but the concat dim, so
+                # the variables need not be compared across the files
+                with xr.open_mfdataset(
+                    paths,
+                    engine="scipy",
+                    combine="nested",
+                    concat_dim=concat_dim,
+                    data_vars="minimal",
+                    coords="minimal",
+                    compat="override",
+                    combine_attrs="override",
+                    parallel=True,
+                ) as ds:
+                    new_combined = ds.load()
 
-                new_combined.to_netcdf(combined_ds_path, engine="scipy")
+            self._write_combined_dataset(group, new_combined, concat_dim)
 
-                if delete_after:
-                    for p in paths:
-                        os.remove(p)
+            if delete_after:
+                for p in paths:
+                    os.remove(p)
 
     def unify_responses(self, key: Optional[str] = None) -> None:
         if key is None:
@@ -1325,24 +1758,35 @@ def unify_responses(self, key: Optional[str] = None) -> None:
             has_existing_combined = os.path.exists(self._path / "gen_data.nc")
 
             # If gen data, combine across reals,
-            # but also across all name(s) into one gen_data.nc
+            # but also across all name(s) into one gen_data.nc.
+            # The datasets only differ along the concat dims (and in the
+            # index/report_step labels, which are still outer joined), so
+            # the remaining variables are not compared when concatenating.
 
             files_to_remove = []
             to_concat = []
+            files_by_group = self._find_realization_files(gen_data_keys)
             for group in gen_data_keys:
-                paths = sorted(
-                    self.mount_point.glob(f"realization-*/{glob.escape(group)}.nc")
-                )
+                paths = files_by_group[group]
 
                 if len(paths) > 0:
-                    ds_for_group = xr.concat(
-                        [
-                            ds.expand_dims(name=[group], axis=1)
-                            for ds in [
-                                xr.open_dataset(p, engine="scipy") for p in paths
-                            ]
-                        ],
-                        dim="realization",
+                    datasets_for_group = [
+                        xr.open_dataset(p, engine="scipy").expand_dims(
+                            name=[group], axis=1
+                        )
+                        for p in paths
+                    ]
+                    ds_for_group = (
+                        datasets_for_group[0]
+                        if len(datasets_for_group) == 1
+                        else xr.concat(
+                            datasets_for_group,
+                            dim="realization",
+                            data_vars="minimal",
+                            coords="minimal",
+                            compat="override",
+                            join="outer",
+                        )
                     )
                     to_concat.append(ds_for_group)
 
@@ -1350,9 +1794,18 @@ def unify_responses(self, key: Optional[str] = None) -> None:
 
             # Ensure deterministic ordering wrt name and real
             if to_concat:
-                new_combined_ds = xr.concat(to_concat, dim="name").sortby(
-                    ["realization", "name"]
-                )
+                new_combined_ds = (
+                    to_concat[0]
+                    if len(to_concat) == 1
+                    else xr.concat(
+                        to_concat,
+                        dim="name",
+                        data_vars="minimal",
+                        coords="minimal",
+                        compat="override",
+                        join="outer",
+                    )
+                ).sortby(["realization", "name"])
                 new_combined_ds = self._ensure_correct_coordinate_order(new_combined_ds)
 
                 if has_existing_combined:
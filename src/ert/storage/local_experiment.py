@@ -5,9 +5,19 @@
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
 from uuid import UUID
 
+import netCDF4
 import numpy as np
 import xarray as xr
 import xtgeo
@@ -52,6 +62,43 @@ class _Index(BaseModel):
     name: str
 
 
+class _ObservationDatasets(Mapping[str, xr.Dataset]):
+    """
+    The observation datasets of an experiment by response type. Each
+    dataset is opened the first time it is accessed.
+    """
+
+    def __init__(self, paths: Dict[str, Path]) -> None:
+        self._paths = paths
+        self._datasets: Dict[str, xr.Dataset] = {}
+
+    def __getitem__(self, key: str) -> xr.Dataset:
+        if key not in self._datasets:
+            self._datasets[key] = xr.open_dataset(self._paths[key], engine="scipy")
+        return self._datasets[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def obs_names(self) -> List[str]:
+        """
+        The obs_name coordinates of all the datasets. Datasets that are not
+        opened yet are not decoded by xarray, only their obs_name variable
+        is read.
+        """
+        names: List[str] = []
+        for key, path in self._paths.items():
+            if key in self._datasets:
+                names.extend(self._datasets[key]["obs_name"].data.tolist())
+            else:
+                with netCDF4.Dataset(path) as nc:
+                    names.extend(nc.variables["obs_name"][:].tolist())
+        return names
+
+
 class LocalExperiment(BaseMode):
     """
     Represents an experiment within the local storage system of ERT.
@@ -86,9 +133,7 @@ def __init__(
         super().__init__(mode)
         self._storage = storage
         self._path = path
-        self._index = _Index.model_validate_json(
-            (path / "index.json").read_text(encoding="utf-8")
-        )
+        self._index = _Index.model_validate_json((path / "index.json").read_bytes())
 
     @classmethod
     def create(
@@ -227,7 +272,7 @@ def id(self) -> UUID:
     def mount_point(self) -> Path:
         return self._path
 
-    @property
+    @cached_property
     def parameter_info(self) -> Dict[str, Any]:
         info: Dict[str, Any]
         path = self.mount_point / self._parameter_file
@@ -237,7 +282,7 @@ def parameter_info(self) -> Dict[str, Any]:
             info = json.load(f)
         return info
 
-    @property
+    @cached_property
     def response_info(self) -> Dict[str, Any]:
         info: Dict[str, Any]
         path = self.mount_point / self._responses_file
@@ -271,7 +316,9 @@ def get_surface(self, name: str) -> xtgeo.RegularSurface:
     @cached_property
     def parameter_configuration(self) -> Dict[str, ParameterConfig]:
         params = {}
-        for data in self.parameter_info.values():
+        for info in self.parameter_info.values():
+            # Copied so that the cached parameter_info is left as it is
+            data = dict(info)
             param_type = data.pop("_ert_kind")
             params[data["name"]] = _KNOWN_PARAMETER_TYPES[param_type](**data)
         return params
@@ -279,7 +326,8 @@ def parameter_configuration(self) -> Dict[str, ParameterConfig]:
     @cached_property
     def response_configuration(self) -> Dict[str, ResponseConfig]:
         params = {}
-        for data in self.response_info.values():
+        for info in self.response_info.values():
+            data = dict(info)
             param_type = data.pop("_ert_kind")
             params[data["name"]] = _KNOWN_RESPONSE_TYPES[param_type](**data)
         return params
@@ -289,15 +337,15 @@ def update_parameters(self) -> List[str]:
         return [p.name for p in self.parameter_configuration.values() if p.update]
 
     @cached_property
-    def observations(self) -> Dict[str, xr.Dataset]:
-        observations = sorted(list(self.mount_point.glob("observations/*")))
-        obs_by_response_type = {}
-
-        for obs_file in observations:
-            ds = xr.open_dataset(obs_file, engine="scipy")
-            obs_by_response_type[ds.attrs["response"]] = ds
-
-        return obs_by_response_type
+    def observations(self) -> _ObservationDatasets:
+        # The observation files are named after their response type
+        # (with or without an .nc suffix), so they need not be opened
+        # to know which response type they hold
+        paths = {}
+        for obs_file in sorted(self.mount_point.glob("observations/*")):
+            response_type = obs_file.stem if obs_file.suffix == ".nc" else obs_file.name
+            paths[response_type] = obs_file
+        return _ObservationDatasets(paths)
 
     @cached_property
     def observation_keys(self) -> List[str]:
@@ -305,11 +353,7 @@ def observation_keys(self) -> List[str]:
         Gets all \"name\" values for all observations. I.e.,
         the summary keyword, the gen_data observation name etc.
         """
-        keys = []
-        for ds in self.observations.values():
-            keys.extend(ds["obs_name"].data.tolist())
-
-        return sorted(keys)
+        return sorted(self.observations.obs_names())
 
     def observations_for_response(self, response_name: str) -> xr.Dataset:
         for ds in self.observations.values():
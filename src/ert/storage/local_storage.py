@@ -193,9 +193,7 @@ def ensembles(self) -> Generator[LocalEnsemble, None, None]:
 
     def _load_index(self) -> _Index:
         try:
-            return _Index.model_validate_json(
-                (self.path / "index.json").read_text(encoding="utf-8")
-            )
+            return _Index.model_validate_json((self.path / "index.json").read_bytes())
         except FileNotFoundError:
             return _Index()
 
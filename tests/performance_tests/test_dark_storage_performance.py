@@ -1,36 +1,53 @@
+import atexit
 import io
-from asyncio import get_event_loop
+from asyncio import new_event_loop
 from typing import Awaitable, TypeVar
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from pyarrow import csv as pa_csv
 
 from ert.config import ErtConfig
-from ert.dark_storage.endpoints import ensembles, experiments, records
+from ert.dark_storage.endpoints import records
 from ert.enkf_main import EnKFMain
 from ert.libres_facade import LibresFacade
 from ert.storage import open_storage
 
 T = TypeVar("T")
 
+_LOOP = new_event_loop()
+atexit.register(_LOOP.close)
+
 
 def run_in_loop(coro: Awaitable[T]) -> T:
-    return get_event_loop().run_until_complete(coro)
+    return _LOOP.run_until_complete(coro)
 
 
-def get_single_record_csv(storage, ensemble_id1, keyword, poly_ran):
-    csv = run_in_loop(
-        records.get_ensemble_record(
-            storage=storage,
-            name=keyword,
-            ensemble_id=ensemble_id1,
-        )
-    ).body
-    record_df1_indexed = pd.read_csv(
-        io.BytesIO(csv), index_col=0, float_precision="round_trip"
-    )
-    assert len(record_df1_indexed.columns) == poly_ran["gen_data_entries"]
-    assert len(record_df1_indexed.index) == 1
+RECORD_KEYS = {
+    "summary": "PSUM1",
+    "gen_data": "POLY_RES_1@0",
+    "summary_with_obs": "PSUM0",
+    "gen_data_with_obs": "POLY_RES_0@0",
+}
+OBSERVATION_KEYS = {
+    "summary": "PSUM1",
+    "gen_data": "POLY_RES_1@0",
+    "summary_with_obs": "PSUM0",
+    "gen_data_with_obs": "POLY_RES_0",
+}
+
+
+@pytest.fixture(scope="session")
+def default_ensemble(template_config):
+    with template_config["folder"].as_cwd():
+        config = ErtConfig.from_file("poly.ert")
+        ert = EnKFMain(config)
+        enkf_facade = LibresFacade(ert)
+        storage = open_storage(enkf_facade.enspath)
+
+    yield storage, storage.get_ensemble_by_name("default").id
+    storage.close()
 
 
 def get_record_observations(storage, ensemble_id, keyword: str, poly_ran):
@@ -68,6 +85,18 @@ def get_record_observations(storage, ensemble_id, keyword: str, poly_ran):
         raise AssertionError(f"should never get here, keyword is {keyword}")
 
 
+def get_record_csv(storage, ensemble_id1, keyword, poly_ran):
+    csv = run_in_loop(
+        records.get_ensemble_record(
+            storage=storage, name=keyword, ensemble_id=ensemble_id1
+        )
+    ).body
+    record_table = pa_csv.read_csv(pa.BufferReader(csv))
+    # The first column holds the realization index
+    assert record_table.num_columns - 1 == poly_ran["gen_data_entries"]
+    assert record_table.num_rows == poly_ran["reals"]
+
+
 def get_record_parquet(storage, ensemble_id1, keyword, poly_ran):
     parquet = run_in_loop(
         records.get_ensemble_record(
@@ -77,20 +106,13 @@ def get_record_parquet(storage, ensemble_id1, keyword, poly_ran):
             accept="application/x-parquet",
         )
     ).body
-    record_df1 = pd.read_parquet(io.BytesIO(parquet))
-    assert len(record_df1.columns) == poly_ran["gen_data_entries"]
-    assert len(record_df1.index) == poly_ran["reals"]
-
-
-def get_record_csv(storage, ensemble_id1, keyword, poly_ran):
-    csv = run_in_loop(
-        records.get_ensemble_record(
-            storage=storage, name=keyword, ensemble_id=ensemble_id1
-        )
-    ).body
-    record_df1 = pd.read_csv(io.BytesIO(csv), index_col=0, float_precision="round_trip")
-    assert len(record_df1.columns) == poly_ran["gen_data_entries"]
-    assert len(record_df1.index) == poly_ran["reals"]
+    metadata = pq.read_metadata(io.BytesIO(parquet))
+    # A RangeIndex is only stored in the pandas metadata, other indexes
+    # are stored as columns
+    index_columns = metadata.schema.to_arrow_schema().pandas_metadata["index_columns"]
+    num_index_columns = sum(isinstance(column, str) for column in index_columns)
+    assert metadata.num_columns - num_index_columns == poly_ran["gen_data_entries"]
+    assert metadata.num_rows == poly_ran["reals"]
 
 
 def get_parameters(storage, ensemble_id1, keyword, poly_ran):
@@ -116,30 +138,12 @@ def get_parameters(storage, ensemble_id1, keyword, poly_ran):
 )
 @pytest.mark.integration_test
 def test_direct_dark_performance(
-    benchmark, template_config, monkeypatch, function, keyword
+    benchmark, template_config, default_ensemble, function, keyword
 ):
-    key = {
-        "summary": "PSUM1",
-        "gen_data": "POLY_RES_1@0",
-        "summary_with_obs": "PSUM0",
-        "gen_data_with_obs": "POLY_RES_0@0",
-    }[keyword]
+    key = RECORD_KEYS[keyword]
 
-    with template_config["folder"].as_cwd():
-        config = ErtConfig.from_file("poly.ert")
-        ert = EnKFMain(config)
-        enkf_facade = LibresFacade(ert)
-        storage = open_storage(enkf_facade.enspath)
-        experiment_json = experiments.get_experiments(storage=storage)
-        ensemble_id_default = None
-        for ensemble_id in experiment_json[0].ensemble_ids:
-            ensemble_json = ensembles.get_ensemble(
-                storage=storage, ensemble_id=ensemble_id
-            )
-            if ensemble_json.userdata["name"] == "default":
-                ensemble_id_default = ensemble_id
-
-        benchmark(function, storage, ensemble_id_default, key, template_config)
+    storage, ensemble_id_default = default_ensemble
+    benchmark(function, storage, ensemble_id_default, key, template_config)
 
 
 @pytest.mark.parametrize(
@@ -153,27 +157,9 @@ def test_direct_dark_performance(
 )
 @pytest.mark.integration_test
 def test_direct_dark_performance_with_storage(
-    benchmark, template_config, monkeypatch, function, keyword
+    benchmark, template_config, default_ensemble, function, keyword
 ):
-    key = {
-        "summary": "PSUM1",
-        "gen_data": "POLY_RES_1@0",
-        "summary_with_obs": "PSUM0",
-        "gen_data_with_obs": "POLY_RES_0",
-    }[keyword]
+    key = OBSERVATION_KEYS[keyword]
 
-    with template_config["folder"].as_cwd():
-        config = ErtConfig.from_file("poly.ert")
-        ert = EnKFMain(config)
-        enkf_facade = LibresFacade(ert)
-        storage = open_storage(enkf_facade.enspath)
-        experiment_json = experiments.get_experiments(storage=storage)
-        ensemble_id_default = None
-        for ensemble_id in experiment_json[0].ensemble_ids:
-            ensemble_json = ensembles.get_ensemble(
-                storage=storage, ensemble_id=ensemble_id
-            )
-            if ensemble_json.userdata["name"] == "default":
-                ensemble_id_default = ensemble_id
-
-        benchmark(function, storage, ensemble_id_default, key, template_config)
+    storage, ensemble_id_default = default_ensemble
+    benchmark(function, storage, ensemble_id_default, key, template_config)
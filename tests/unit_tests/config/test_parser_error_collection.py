@@ -1,8 +1,11 @@
 import os
 import re
+import shutil
 import stat
 import warnings
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from textwrap import dedent
 from typing import Dict, List, Optional, Sequence, Union
 
@@ -16,6 +19,24 @@
 test_config_filename = f"{test_config_file_base}.ert"
 
 
+@pytest.fixture(scope="module")
+def shared_tmpdir(tmp_path_factory):
+    return tmp_path_factory.mktemp("parser_error_collection")
+
+
+@pytest.fixture()
+def use_shared_tmpdir(shared_tmpdir, monkeypatch):
+    """Run in a directory shared by the whole module, and remove everything
+    the test created afterwards, instead of creating a new tmpdir per test."""
+    monkeypatch.chdir(shared_tmpdir)
+    yield
+    for path in shared_tmpdir.iterdir():
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+
 @dataclass
 class FileDetail:
     contents: str
@@ -37,17 +58,16 @@ class ExpectedErrorInfo:
 def write_files(files: Optional[Dict[str, Union[str, FileDetail]]] = None):
     if files is not None:
         for other_filename, content in files.items():
-            with open(other_filename, mode="w", encoding="utf-8") as fh:
-                if isinstance(content, FileDetail):
-                    fh.writelines(content.contents)
+            if isinstance(content, FileDetail):
+                Path(other_filename).write_text(content.contents, encoding="utf-8")
 
-                    if not content.is_executable:
-                        os.chmod(other_filename, stat.S_IREAD)
+                if not content.is_executable:
+                    os.chmod(other_filename, stat.S_IREAD)
 
-                    if not content.is_readable:
-                        os.chmod(other_filename, ~0o400)
-                else:
-                    fh.write(content)
+                if not content.is_readable:
+                    os.chmod(other_filename, ~0o400)
+            else:
+                Path(other_filename).write_text(content, encoding="utf-8")
 
 
 def find_and_assert_errors_matching_filename(
@@ -72,15 +92,12 @@ def find_and_assert_errors_matching_location(
     column: Optional[int] = None,
     end_column: Optional[int] = None,
 ):
-    def equals_or_expected_any(actual, expected):
-        return True if expected is None else actual == expected
-
     matching_errors = [
         x
         for x in errors
-        if equals_or_expected_any(x.line, line)
-        and equals_or_expected_any(x.column, column)
-        and equals_or_expected_any(x.end_column, end_column)
+        if (line is None or x.line == line)
+        and (column is None or x.column == column)
+        and (end_column is None or x.end_column == end_column)
     ]
 
     def none_to_star(val: Optional[int] = None):
@@ -96,45 +113,43 @@ def none_to_star(val: Optional[int] = None):
     return matching_errors
 
 
+@lru_cache(maxsize=None)
+def compile_match(match: str) -> "re.Pattern[str]":
+    return re.compile(match)
+
+
 def find_and_assert_errors_matching_message(
     errors: List[ErrorInfo], match: Optional[str] = None
 ):
     if match is None:
         return errors
 
-    re_match = re.compile(match)
-    matching_errors = [err for err in errors if re.search(re_match, err.message)]
+    re_match = compile_match(match)
+    matching_errors = [err for err in errors if re_match.search(err.message)]
 
     assert len(matching_errors) > 0, f"Expected to find error matching message {match}"
 
     return matching_errors
 
 
-def assert_that_config_leads_to_error(
+def write_config_files(
     config_file_contents: str,
-    expected_error: ExpectedErrorInfo,
-    config_filename: str = "test.ert",
+    expected_errors: Sequence[ExpectedErrorInfo],
+    config_filename: str,
 ):
-    write_files(
-        {config_filename: config_file_contents, **(expected_error.other_files or {})}
-    )
-
-    with pytest.raises(ConfigValidationError) as caught_error:
-        ErtConfig.from_file(config_filename)
-        # If the ert config did not raise any errors
-        # we manually raise an "empty" error to make
-        # this raise an assertion error that can be
-        # acted upon from assert_that_config_does_not_lead_to_error
-        raise ConfigValidationError(errors=[])
+    other_files: Dict[str, Union[str, FileDetail]] = {}
+    for expected_error in expected_errors:
+        other_files.update(expected_error.other_files or {})
+    write_files({config_filename: config_file_contents, **other_files})
 
-    collected_errors = caught_error.value.errors
-
-    if len(collected_errors) == 0:
-        raise AssertionError("Config did not lead to any errors")
 
+def assert_errors_match(
+    errors: Sequence[ErrorInfo],
+    expected_error: ExpectedErrorInfo,
+):
     # Find errors in matching file
     errors_matching_filename = find_and_assert_errors_matching_filename(
-        errors=collected_errors, filename=expected_error.filename
+        errors=errors, filename=expected_error.filename
     )
 
     errors_matching_location = find_and_assert_errors_matching_location(
@@ -155,15 +170,47 @@ def assert_that_config_leads_to_error(
         )
 
 
-def assert_that_config_leads_to_warning(
+def assert_that_config_leads_to_errors(
+    config_file_contents: str,
+    expected_errors: Sequence[ExpectedErrorInfo],
+    config_filename: str = "test.ert",
+):
+    write_config_files(config_file_contents, expected_errors, config_filename)
+
+    with pytest.raises(ConfigValidationError) as caught_error:
+        ErtConfig.from_file(config_filename)
+        # If the ert config did not raise any errors
+        # we manually raise an "empty" error to make
+        # this raise an assertion error that can be
+        # acted upon from assert_that_config_does_not_lead_to_error
+        raise ConfigValidationError(errors=[])
+
+    collected_errors = caught_error.value.errors
+
+    if len(collected_errors) == 0:
+        raise AssertionError("Config did not lead to any errors")
+
+    for expected_error in expected_errors:
+        assert_errors_match(collected_errors, expected_error)
+
+
+def assert_that_config_leads_to_error(
     config_file_contents: str,
     expected_error: ExpectedErrorInfo,
     config_filename: str = "test.ert",
 ):
-    write_files(
-        {config_filename: config_file_contents, **(expected_error.other_files or {})}
+    assert_that_config_leads_to_errors(
+        config_file_contents, [expected_error], config_filename=config_filename
     )
 
+
+def assert_that_config_leads_to_warnings(
+    config_file_contents: str,
+    expected_errors: Sequence[ExpectedErrorInfo],
+    config_filename: str = "test.ert",
+):
+    write_config_files(config_file_contents, expected_errors, config_filename)
+
     with warnings.catch_warnings(record=True) as all_warnings:
         _ = ErtConfig.from_file(config_filename)
 
@@ -171,28 +218,19 @@ def assert_that_config_leads_to_warning(
         w.message.info for w in all_warnings if isinstance(w.message, ConfigWarning)
     ]
 
-    warnings_matching_filename = find_and_assert_errors_matching_filename(
-        errors=config_warnings,
-        filename=expected_error.filename,
-    )
+    for expected_error in expected_errors:
+        assert_errors_match(config_warnings, expected_error)
 
-    warnings_matching_location = find_and_assert_errors_matching_location(
-        errors=warnings_matching_filename,
-        line=expected_error.line,
-        column=expected_error.column,
-        end_column=expected_error.end_column,
-    )
 
-    warnings_matching_message = find_and_assert_errors_matching_message(
-        errors=warnings_matching_location, match=expected_error.match
+def assert_that_config_leads_to_warning(
+    config_file_contents: str,
+    expected_error: ExpectedErrorInfo,
+    config_filename: str = "test.ert",
+):
+    assert_that_config_leads_to_warnings(
+        config_file_contents, [expected_error], config_filename=config_filename
     )
 
-    if expected_error.count is not None:
-        assert len(warnings_matching_message) == expected_error.count, (
-            f"Expected to find exactly {expected_error.count} errors, "
-            f"found {len(warnings_matching_message)}."
-        )
-
 
 def assert_that_config_does_not_lead_to_error(
     config_file_contents: str,
@@ -207,7 +245,7 @@ def assert_that_config_does_not_lead_to_error(
         )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_disallowed_argument_is_located_1fn():
     assert_that_config_leads_to_error(
         config_file_contents="QUEUE_OPTION DOCAL MAX_RUNNING 4",
@@ -308,15 +346,14 @@ def test_that_disallowed_argument_is_located_1fn():
         )
     ],
 )
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_multiple_keyword_specific_tokens_are_located(contents, expected_errors):
-    for expected_error in expected_errors:
-        assert_that_config_leads_to_error(
-            config_file_contents=contents, expected_error=expected_error
-        )
+    assert_that_config_leads_to_errors(
+        config_file_contents=contents, expected_errors=expected_errors
+    )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 @given(
     strategies.lists(
         strategies.sampled_from(
@@ -352,13 +389,12 @@ def test_that_multiple_keyword_specific_tokens_are_located_shuffle(error_lines):
         for i, line in enumerate(error_lines)
     ]
 
-    for err in expected_errors:
-        assert_that_config_leads_to_error(
-            config_file_contents=contents, expected_error=err
-        )
+    assert_that_config_leads_to_errors(
+        config_file_contents=contents, expected_errors=expected_errors
+    )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_not_declared_num_realizations_leads_to_only_one_error():
     assert_that_config_leads_to_error(
         config_file_contents="",
@@ -366,7 +402,7 @@ def test_not_declared_num_realizations_leads_to_only_one_error():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_invalid_num_realizations_does_not_lead_to_unset_error():
     assert_that_config_does_not_lead_to_error(
         config_file_contents="NUM_REALIZATIONS ert",
@@ -384,7 +420,7 @@ def test_invalid_num_realizations_does_not_lead_to_unset_error():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_summary_without_eclbase():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -402,8 +438,8 @@ def test_summary_without_eclbase():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
-def test_that_include_non_existing_file_errors_with_location(tmpdir):
+@pytest.mark.usefixtures("use_shared_tmpdir")
+def test_that_include_non_existing_file_errors_with_location():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
             """
@@ -421,8 +457,8 @@ def test_that_include_non_existing_file_errors_with_location(tmpdir):
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
-def test_that_include_with_too_many_args_errors_with_location(tmpdir):
+@pytest.mark.usefixtures("use_shared_tmpdir")
+def test_that_include_with_too_many_args_errors_with_location():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
             """
@@ -439,8 +475,8 @@ def test_that_include_with_too_many_args_errors_with_location(tmpdir):
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
-def test_include_with_too_many_args_error_is_located_indirect(tmpdir):
+@pytest.mark.usefixtures("use_shared_tmpdir")
+def test_include_with_too_many_args_error_is_located_indirect():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
             """
@@ -463,7 +499,7 @@ def test_include_with_too_many_args_error_is_located_indirect(tmpdir):
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_queue_option_max_running_non_int():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -514,15 +550,14 @@ def test_queue_option_max_running_non_int():
         )
     ],
 )
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_multiple_include_non_existing_files_are_located(contents, expected_errors):
-    for expected_error in expected_errors:
-        assert_that_config_leads_to_error(
-            config_file_contents=contents, expected_error=expected_error
-        )
+    assert_that_config_leads_to_errors(
+        config_file_contents=contents, expected_errors=expected_errors
+    )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_cyclical_import_error_is_located():
     assert_that_config_leads_to_error(
         config_file_contents="""
@@ -549,7 +584,7 @@ def test_that_cyclical_import_error_is_located():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_cyclical_import_error_is_located_branch():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -612,7 +647,7 @@ def test_that_cyclical_import_error_is_located_branch():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 @pytest.mark.parametrize("n", range(1, 10))
 def test_that_cyclical_import_error_is_located_stop_early(n):
     other_include_files = {
@@ -661,7 +696,7 @@ def test_that_cyclical_import_error_is_located_stop_early(n):
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_queue_option_max_running_negative():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -680,7 +715,7 @@ def test_queue_option_max_running_negative():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_unicode_decode_error_is_localized_first_line():
     with open("test.ert", "ab") as f:
         f.write(b"\xff")
@@ -716,7 +751,7 @@ def test_that_unicode_decode_error_is_localized_first_line():
     assert collected_errors[0].line == 1
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_unicode_decode_error_is_localized_random_line_single_insert():
     lines = """
         QUEUE_OPTION DOCAL MAX_RUNNING 4
@@ -734,14 +769,11 @@ def test_that_unicode_decode_error_is_localized_random_line_single_insert():
         before = lines[0:insertion_index]
         after = lines[insertion_index : len(lines)]
 
-        with open("test.ert", "w", encoding="utf-8") as f:
-            f.write("\n".join(before) + "\n")
-
-        with open("test.ert", "ab") as f:
-            f.write(b"\xff")
-
-        with open("test.ert", "a", encoding="utf-8") as f:
-            f.write("\n" + "\n".join(after))
+        Path("test.ert").write_bytes(
+            ("\n".join(before) + "\n").encode("utf-8")
+            + b"\xff"
+            + ("\n" + "\n".join(after)).encode("utf-8")
+        )
 
         with pytest.raises(
             ConfigValidationError,
@@ -760,7 +792,7 @@ def test_that_unicode_decode_error_is_localized_random_line_single_insert():
         assert collected_errors[0].end_column == -1
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 @given(
     lines=strategies.lists(
         strategies.sampled_from(
@@ -791,17 +823,14 @@ def test_that_unicode_decode_error_is_localized_multiple_random_inserts(
     for offset, index in enumerate(sorted(insertion_indices)):
         write_infos.insert(index + offset, {"type": "bytes", "content": b"\xff"})
 
-    for i, info in enumerate(write_infos):
-        if info["type"] == "utf-8":
-            with open("test.ert", "w" if i == 0 else "a", encoding="utf-8") as f:
-                f.write(info["content"])
-        elif info["type"] == "bytes":
-            with open("test.ert", "wb" if i == 0 else "ab") as f:
-                f.write(info["content"])
-
-        if i < (len(write_infos) - 1):
-            with open("test.ert", "a", encoding="utf-8") as f:
-                f.write("\n")
+    Path("test.ert").write_bytes(
+        b"\n".join(
+            info["content"].encode("utf-8")
+            if info["type"] == "utf-8"
+            else info["content"]
+            for info in write_infos
+        )
+    )
 
     with pytest.raises(
         ConfigValidationError,
@@ -820,7 +849,7 @@ def test_that_unicode_decode_error_is_localized_multiple_random_inserts(
         assert expected_error is not None, f"Expected to find error on line {line + 1}"
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_non_existing_workflow_is_localized():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -837,7 +866,7 @@ def test_that_non_existing_workflow_is_localized():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_non_readable_workflow_job_is_localized():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -858,7 +887,7 @@ def test_that_non_readable_workflow_job_is_localized():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_non_readable_workflow_job_in_directory_is_localized():
     os.mkdir("hello")
     assert_that_config_leads_to_error(
@@ -882,7 +911,7 @@ def test_that_non_readable_workflow_job_in_directory_is_localized():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_hook_workflow_without_existing_job_error_is_located():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -899,7 +928,7 @@ def test_that_hook_workflow_without_existing_job_error_is_located():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_non_int_followed_by_negative_wont_re_trigger_negative_error():
     assert_that_config_does_not_lead_to_error(
         config_file_contents=dedent(
@@ -916,7 +945,7 @@ def test_that_non_int_followed_by_negative_wont_re_trigger_negative_error():
 
 
 @pytest.mark.parametrize("dirname", ["the_dir", "/tmp"])
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_executable_directory_errors(dirname):
     os.mkdir("the_dir")
     assert_that_config_leads_to_error(
@@ -1079,15 +1108,14 @@ def test_that_executable_directory_errors(dirname):
         )
     ],
 )
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_deprecations_are_handled(contents, expected_errors):
-    for expected_error in expected_errors:
-        assert_that_config_leads_to_warning(
-            config_file_contents=contents, expected_error=expected_error
-        )
+    assert_that_config_leads_to_warnings(
+        config_file_contents=contents, expected_errors=expected_errors
+    )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_invalid_ensemble_result_file_errors():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -1106,7 +1134,7 @@ def test_that_invalid_ensemble_result_file_errors():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_missing_report_steps_errors():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -1125,7 +1153,7 @@ def test_that_missing_report_steps_errors():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_valid_gen_data_does_not_error():
     assert_that_config_does_not_lead_to_error(
         config_file_contents=dedent(
@@ -1139,7 +1167,7 @@ def test_that_valid_gen_data_does_not_error():
     )
 
 
-@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.usefixtures("use_shared_tmpdir")
 def test_that_empty_define_gives_error():
     assert_that_config_leads_to_error(
         config_file_contents=dedent(
@@ -128,11 +128,11 @@ def test_no_storage(obs_key, expected_msg, storage):
 
 
 def create_summary_observation():
-    observations = ""
-    values = np.random.uniform(0, 1.5, 200)
+    rng = np.random.default_rng()
+    values = rng.uniform(0, 1.5, 200)
     errors = values * 0.1
-    for restart, (value, error) in enumerate(zip(values, errors)):
-        observations += f"""
+    return "".join(
+        f"""
     \nSUMMARY_OBSERVATION FOPR_{restart + 1}
 {{
     VALUE   = {value};
@@ -141,15 +141,16 @@ def create_summary_observation():
     KEY     = FOPR;
 }};
     """
-    return observations
+        for restart, (value, error) in enumerate(
+            zip(np.char.mod("%.6g", values), np.char.mod("%.6g", errors))
+        )
+    )
 
 
 def create_general_observation():
-    observations = ""
-    index_list = np.array(range(2000))
-    index_list = [index_list[i : i + 4] for i in range(0, len(index_list), 4)]
-    for nr, (i1, i2, i3, i4) in enumerate(index_list):
-        observations += f"""
+    index_list = np.arange(2000).reshape(-1, 4)
+    return "".join(
+        f"""
     \nGENERAL_OBSERVATION CUSTOM_DIFF_{nr}
 {{
    DATA       = SNAKE_OIL_WPR_DIFF;
@@ -158,7 +159,8 @@ def create_general_observation():
    OBS_FILE   = wpr_diff_obs.txt;
 }};
     """
-    return observations
+        for nr, (i1, i2, i3, i4) in enumerate(index_list)
+    )
 
 
 def test_all_measured_snapshot(snapshot, facade_snake_oil, create_measured_data):
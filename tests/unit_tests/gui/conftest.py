@@ -1,17 +1,15 @@
 import contextlib
-import copy
-import fileinput
 import os
 import os.path
+import re
 import shutil
 import stat
-import time
 from contextlib import contextmanager
 from datetime import datetime as dt
 from pathlib import Path
 from textwrap import dedent
 from typing import Generator, List, Tuple, Type, TypeVar
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import pytest
 from pytestqt.qtbot import QtBot
@@ -25,7 +23,6 @@
     RealizationSnapshot,
     Snapshot,
     SnapshotBuilder,
-    SnapshotDict,
 )
 from ert.ensemble_evaluator.state import (
     ENSEMBLE_STATE_STARTED,
@@ -53,12 +50,19 @@
 from tests.unit_tests.gui.simulation.test_run_path_dialog import handle_run_path_dialog
 
 
+@pytest.fixture(scope="session")
+def _poly_template(source_root, tmp_path_factory):
+    path = tmp_path_factory.mktemp("poly_template")
+    _new_poly_example(source_root, path)
+    return path
+
+
 @pytest.fixture
 def opened_main_window(
-    source_root, tmp_path, monkeypatch
+    _poly_template, tmp_path, monkeypatch
 ) -> Generator[ErtMainWindow, None, None]:
     monkeypatch.chdir(tmp_path)
-    _new_poly_example(source_root, tmp_path)
+    shutil.copytree(_poly_template, tmp_path, dirs_exist_ok=True)
     with _open_main_window(tmp_path) as (
         gui,
         storage,
@@ -77,14 +81,18 @@ def _new_poly_example(source_root, destination):
         dirs_exist_ok=True,
     )
 
-    with fileinput.input(destination / "poly.ert", inplace=True) as fin:
-        for line in fin:
-            if "NUM_REALIZATIONS" in line:
-                # Decrease the number of realizations to speed up the test,
-                # if there is flakyness, this can be increased.
-                print("NUM_REALIZATIONS 20", end="\n")
-            else:
-                print(line, end="")
+    config_file = Path(destination) / "poly.ert"
+    # Decrease the number of realizations to speed up the test,
+    # if there is flakyness, this can be increased.
+    config_file.write_text(
+        re.sub(
+            r"^.*NUM_REALIZATIONS.*$",
+            "NUM_REALIZATIONS 20",
+            config_file.read_text(encoding="utf-8"),
+            flags=re.MULTILINE,
+        ),
+        encoding="utf-8",
+    )
 
 
 def _add_default_ensemble(storage: Storage, gui: ErtMainWindow, config: ErtConfig):
@@ -119,19 +127,19 @@ def _open_main_window(
 
 
 @pytest.fixture
-def opened_main_window_clean(source_root, tmp_path, monkeypatch):
+def opened_main_window_clean(_poly_template, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
-    _new_poly_example(source_root, tmp_path)
+    shutil.copytree(_poly_template, tmp_path, dirs_exist_ok=True)
     with _open_main_window(tmp_path) as (gui, _, config), StorageService.init_service(
         project=os.path.abspath(config.ens_path),
     ):
         yield gui
 
 
-@pytest.fixture(scope="module")
-def _esmda_run(run_experiment, source_root, tmp_path_factory):
+@pytest.fixture(scope="session")
+def _esmda_run(run_experiment, _poly_template, tmp_path_factory):
     path = tmp_path_factory.mktemp("test-data")
-    _new_poly_example(source_root, path)
+    shutil.copytree(_poly_template, path, dirs_exist_ok=True)
     with pytest.MonkeyPatch.context() as mp, _open_main_window(path) as (
         gui,
         storage,
@@ -150,10 +158,10 @@ def _esmda_run(run_experiment, source_root, tmp_path_factory):
 
 
 def _ensemble_experiment_run(
-    run_experiment, source_root, tmp_path_factory, failing_reals
+    run_experiment, poly_template, tmp_path_factory, failing_reals
 ):
     path = tmp_path_factory.mktemp("test-data")
-    _new_poly_example(source_root, path)
+    shutil.copytree(poly_template, path, dirs_exist_ok=True)
     with pytest.MonkeyPatch.context() as mp, _open_main_window(path) as (
         gui,
         storage,
@@ -200,6 +208,24 @@ def _evaluate(coeffs, x):
     return path
 
 
+@pytest.fixture(scope="session")
+def _ensemble_experiment_run_with_failures(
+    run_experiment, _poly_template, tmp_path_factory
+):
+    return _ensemble_experiment_run(
+        run_experiment, _poly_template, tmp_path_factory, True
+    )
+
+
+@pytest.fixture(scope="session")
+def _ensemble_experiment_run_without_failures(
+    run_experiment, _poly_template, tmp_path_factory
+):
+    return _ensemble_experiment_run(
+        run_experiment, _poly_template, tmp_path_factory, False
+    )
+
+
 @pytest.fixture
 def esmda_has_run(_esmda_run, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
@@ -216,13 +242,12 @@ def esmda_has_run(_esmda_run, tmp_path, monkeypatch):
 
 @pytest.fixture
 def ensemble_experiment_has_run(
-    tmp_path, monkeypatch, run_experiment, source_root, tmp_path_factory
+    _ensemble_experiment_run_with_failures, tmp_path, monkeypatch
 ):
     monkeypatch.chdir(tmp_path)
-    test_files = _ensemble_experiment_run(
-        run_experiment, source_root, tmp_path_factory, True
+    shutil.copytree(
+        _ensemble_experiment_run_with_failures, tmp_path, dirs_exist_ok=True
     )
-    shutil.copytree(test_files, tmp_path, dirs_exist_ok=True)
     with _open_main_window(tmp_path) as (
         gui,
         _,
@@ -235,13 +260,12 @@ def ensemble_experiment_has_run(
 
 @pytest.fixture
 def ensemble_experiment_has_run_no_failure(
-    tmp_path, monkeypatch, run_experiment, source_root, tmp_path_factory
+    _ensemble_experiment_run_without_failures, tmp_path, monkeypatch
 ):
     monkeypatch.chdir(tmp_path)
-    test_files = _ensemble_experiment_run(
-        run_experiment, source_root, tmp_path_factory, False
+    shutil.copytree(
+        _ensemble_experiment_run_without_failures, tmp_path, dirs_exist_ok=True
     )
-    shutil.copytree(test_files, tmp_path, dirs_exist_ok=True)
     with _open_main_window(tmp_path) as (
         gui,
         _,
@@ -252,7 +276,7 @@ def ensemble_experiment_has_run_no_failure(
         yield gui
 
 
-@pytest.fixture(name="run_experiment", scope="module")
+@pytest.fixture(name="run_experiment", scope="session")
 def run_experiment_fixture(request):
     def func(experiment_mode, gui):
         qtbot = QtBot(request)
@@ -287,7 +311,9 @@ def handle_dialog():
             "Ensemble experiment",
             "Evaluate ensemble",
         ):
-            QTimer.singleShot(500, handle_dialog)
+            # handle_dialog waits for the message box itself, so it can run
+            # as soon as the event loop is entered
+            QTimer.singleShot(0, handle_dialog)
         qtbot.mouseClick(run_experiment, Qt.LeftButton)
 
         # The Run dialog opens, click show details and wait until done appears
@@ -315,6 +341,28 @@ def handle_dialog():
     return func
 
 
+def _snapshot_of_identical_reals(real: RealizationSnapshot, count: int) -> Snapshot:
+    # Dump the realization once and give every copy its own forward model
+    # dicts, as the snapshot keeps references to them
+    real_dump = real.model_dump()
+    return Snapshot(
+        {
+            "status": ENSEMBLE_STATE_STARTED,
+            "reals": {
+                str(i): {
+                    **real_dump,
+                    "forward_models": {
+                        fm_id: dict(fm)
+                        for fm_id, fm in real_dump["forward_models"].items()
+                    },
+                }
+                for i in range(count)
+            },
+            "metadata": {},
+        }
+    )
+
+
 @pytest.fixture()
 def full_snapshot() -> Snapshot:
     real = RealizationSnapshot(
@@ -371,14 +419,7 @@ def full_snapshot() -> Snapshot:
             ),
         },
     )
-    snapshot = SnapshotDict(
-        status=ENSEMBLE_STATE_STARTED,
-        reals={},
-    )
-    for i in range(0, 100):
-        snapshot.reals[str(i)] = copy.deepcopy(real)
-
-    return Snapshot(snapshot.model_dump())
+    return _snapshot_of_identical_reals(real, 100)
 
 
 @pytest.fixture()
@@ -413,76 +454,55 @@ def waiting_snapshot() -> Snapshot:
             ),
         },
     )
-    snapshot = SnapshotDict(
-        status=ENSEMBLE_STATE_STARTED,
-        reals={},
-    )
-    for i in range(0, 1):
-        snapshot.reals[str(i)] = copy.deepcopy(real)
-
-    return Snapshot(snapshot.model_dump())
+    return _snapshot_of_identical_reals(real, 1)
 
 
 @pytest.fixture()
 def large_snapshot() -> Snapshot:
     builder = SnapshotBuilder()
+    start_time = dt(1999, 1, 1)
+    end_time = dt(2019, 1, 1)
     for i in range(0, 150):
+        forward_model_id = str(i)
         builder.add_forward_model(
-            forward_model_id=str(i),
-            index=str(i),
+            forward_model_id=forward_model_id,
+            index=forward_model_id,
             name=f"job_{i}",
             current_memory_usage="500",
             max_memory_usage="1000",
             status=FORWARD_MODEL_STATE_START,
             stdout=f"job_{i}.stdout",
             stderr=f"job_{i}.stderr",
-            start_time=dt(1999, 1, 1),
-            end_time=dt(2019, 1, 1),
+            start_time=start_time,
+            end_time=end_time,
         )
-    real_ids = [str(i) for i in range(0, 150)]
+    real_ids = list(map(str, range(0, 150)))
     return builder.build(real_ids, REALIZATION_STATE_UNKNOWN)
 
 
 @pytest.fixture()
 def small_snapshot() -> Snapshot:
     builder = SnapshotBuilder()
+    start_time = dt(1999, 1, 1)
+    end_time = dt(2019, 1, 1)
     for i in range(0, 2):
+        forward_model_id = str(i)
         builder.add_forward_model(
-            forward_model_id=str(i),
-            index=str(i),
+            forward_model_id=forward_model_id,
+            index=forward_model_id,
             name=f"job_{i}",
             current_memory_usage="500",
             max_memory_usage="1000",
             status=FORWARD_MODEL_STATE_START,
             stdout=f"job_{i}.stdout",
             stderr=f"job_{i}.stderr",
-            start_time=dt(1999, 1, 1),
-            end_time=dt(2019, 1, 1),
+            start_time=start_time,
+            end_time=end_time,
         )
-    real_ids = [str(i) for i in range(0, 5)]
+    real_ids = list(map(str, range(0, 5)))
     return builder.build(real_ids, REALIZATION_STATE_UNKNOWN)
 
 
-@pytest.fixture(name="active_realizations")
-def active_realizations_fixture() -> Mock:
-    active_reals = MagicMock()
-    active_reals.count = Mock(return_value=10)
-    active_reals.__iter__.return_value = [True] * 10
-    return active_reals
-
-
-@pytest.fixture
-def runmodel(active_realizations) -> Mock:
-    brm = Mock()
-    brm.get_runtime = Mock(return_value=100)
-    brm.hasRunFailed = Mock(return_value=False)
-    brm.getFailMessage = Mock(return_value="")
-    brm.support_restart = True
-    brm._simulation_arguments = {"active_realizations": active_realizations}
-    brm.has_failed_realizations = lambda: False
-    return brm
-
-
 class MockTracker:
     def __init__(self, events) -> None:
         self._events = events
@@ -492,7 +512,6 @@ def track(self):
         for event in self._events:
             if not self._is_running:
                 break
-            time.sleep(0.1)
             yield event
 
     def reset(self):
@@ -525,17 +544,20 @@ def handle_load_results_dialog():
 
         # Verify that the messagebox is the success kind
         def handle_popup_dialog():
+            qtbot.waitUntil(
+                lambda: isinstance(QApplication.activeModalWidget(), QMessageBox)
+            )
             messagebox = QApplication.activeModalWidget()
             assert isinstance(messagebox, QMessageBox)
             assert messagebox.text() == "Successfully loaded all realisations"
             ok_button = messagebox.button(QMessageBox.Ok)
             qtbot.mouseClick(ok_button, Qt.LeftButton)
 
-        QTimer.singleShot(2000, handle_popup_dialog)
+        QTimer.singleShot(0, handle_popup_dialog)
         qtbot.mouseClick(load_button, Qt.LeftButton)
         dialog.close()
 
-    QTimer.singleShot(1000, handle_load_results_dialog)
+    QTimer.singleShot(0, handle_load_results_dialog)
     load_results_tool = gui.tools["Load results manually"]
     load_results_tool.trigger()
 
@@ -561,7 +583,7 @@ def handle_add_dialog():
         dialog._ensemble_edit.setText(ensemble_name)
         qtbot.mouseClick(dialog._ok_button, Qt.MouseButton.LeftButton)
 
-    QTimer.singleShot(1000, handle_add_dialog)
+    QTimer.singleShot(0, handle_add_dialog)
     add_widget = get_child(storage_widget, AddWidget)
     qtbot.mouseClick(add_widget.addButton, Qt.MouseButton.LeftButton)
 
@@ -572,8 +594,16 @@ def handle_add_dialog():
 
 
 def wait_for_child(gui, qtbot: QtBot, typ: Type[V], *args, **kwargs) -> V:
-    qtbot.waitUntil(lambda: gui.findChild(typ, *args, **kwargs) is not None)
-    return get_child(gui, typ, *args, **kwargs)
+    child = None
+
+    def find_child() -> bool:
+        nonlocal child
+        child = gui.findChild(typ, *args, **kwargs)
+        return child is not None
+
+    qtbot.waitUntil(find_child)
+    assert isinstance(child, typ)
+    return child
 
 
 def get_child(gui: QWidget, typ: Type[V], *args, **kwargs) -> V:
@@ -6,7 +6,7 @@
 import ert.__main__
 from ert.__main__ import ert_parser
 from ert.mode_definitions import TEST_RUN_MODE
-from ert.shared.feature_toggling import FeatureScheduler
+from ert.shared.feature_toggling import FeatureDowncastFields, FeatureScheduler
 
 
 @pytest.fixture(autouse=True)
@@ -19,6 +19,7 @@ def mocked_valid_file(monkeypatch):
 @pytest.fixture(autouse=True)
 def reset_feature_toggling(monkeypatch):
     monkeypatch.setattr(FeatureScheduler, "_value", None)
+    monkeypatch.setattr(FeatureDowncastFields, "_value", None)
 
 
 @pytest.fixture(autouse=True)
@@ -101,3 +102,28 @@ def test_feature_toggling_incorrect_input(monkeypatch):
     with pytest.raises(ValueError):
         FeatureScheduler.set_value(parsed)
     assert FeatureScheduler._value is None
+
+
+@pytest.mark.parametrize(
+    "environment_vars, arguments, expected",
+    [
+        ({}, [], False),
+        ({"ERT_FEATURE_DOWNCAST_FIELDS": "True"}, [], True),
+        ({"ERT_FEATURE_DOWNCAST_FIELDS": "True"}, ["--disable-downcast-fields"], False),
+        ({}, ["--enable-downcast-fields"], True),
+    ],
+)
+def test_downcast_fields_feature_toggling(environment_vars, arguments, expected):
+    for key, value in environment_vars.items():
+        os.environ[key] = value
+
+    parsed = ert_parser(
+        None,
+        [
+            TEST_RUN_MODE,
+            *arguments,
+            "not_a_real_config.ert",
+        ],
+    )
+    FeatureDowncastFields.set_value(parsed)
+    assert FeatureDowncastFields.is_enabled() is expected
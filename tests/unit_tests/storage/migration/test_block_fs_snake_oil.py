@@ -6,6 +6,7 @@
 import netCDF4
 import numpy as np
 import pytest
+from tests.utils import link_or_copy
 
 import ert.storage
 import ert.storage.migration.block_fs as bf
@@ -45,7 +46,9 @@ def set_ert_config(ert_config):
 
 @pytest.fixture(scope="module")
 def data(block_storage_path):
-    return netCDF4.Dataset(block_storage_path / "data_dump/snake_oil.nc")
+    path = block_storage_path / "data_dump/snake_oil.nc"
+    with netCDF4.Dataset(path.name, memory=path.read_bytes()) as dataset:
+        yield dataset
 
 
 @pytest.fixture(scope="module")
@@ -106,17 +109,15 @@ def test_migrate_summary(data, forecast, time_map, tmp_path):
         bf._migrate_summary(ensemble, forecast, time_map)
         ensemble.unify_responses()
 
-        expected_keys = set(data[group].variables) - set(data[group].dimensions)
+        summary_group = data[group]
+        expected_keys = set(summary_group.variables) - set(summary_group.dimensions)
         assert set(ensemble.get_summary_keyset()) == expected_keys
 
+        summary = ensemble.load_responses("summary", (0,))
         for key in ensemble.get_summary_keyset():
-            expect = np.array(data[group][key])[1:]  # Skip first report_step
-            actual = (
-                ensemble.load_responses("summary", (0,))
-                .sel(name=key)["values"]
-                .data.flatten()
-            )
-            assert list(expect) == list(actual), key
+            expect = np.array(summary_group[key])[1:]  # Skip first report_step
+            actual = summary.sel(name=key)["values"].data.flatten()
+            np.testing.assert_array_equal(expect, actual, err_msg=key)
 
 
 def test_migrate_gen_data(data, forecast, tmp_path):
@@ -136,15 +137,17 @@ def test_migrate_gen_data(data, forecast, tmp_path):
         bf._migrate_gen_data(ensemble, forecast)
         ensemble.unify_responses()
 
-        for key in set(data[group].variables) - set(data[group].dimensions):
-            expect = np.array(data[group][key]).flatten()
+        gen_data_group = data[group]
+        for key in set(gen_data_group.variables) - set(gen_data_group.dimensions):
+            expect = np.array(gen_data_group[key]).flatten()
             actual = ensemble.load_responses(key, (0,))["values"].data.flatten()
-            assert list(expect) == list(actual), key
+            np.testing.assert_array_equal(expect, actual, err_msg=key)
 
 
 @pytest.mark.parametrize("name,iter", [("default_3", 3), ("foobar", 0)])
 def test_migrate_case(data, storage, tmp_path, enspath, ens_config, name, iter):
-    shutil.copytree(enspath, tmp_path, dirs_exist_ok=True)
+    # Migration only reads the block storage files, so hard links will do
+    shutil.copytree(enspath, tmp_path, copy_function=link_or_copy, dirs_exist_ok=True)
     (tmp_path / "default_0").rename(tmp_path / name)
     with ExitStack() as stack:
         bf.migrate_case(storage, tmp_path / name, stack)
@@ -153,21 +156,24 @@ def test_migrate_case(data, storage, tmp_path, enspath, ens_config, name, iter):
     assert ensemble.iteration == iter
     ensemble.unify_parameters()
     ensemble.unify_responses()
+    indices = {
+        real_key: int(re.match(r"REAL_(\d+)", real_key)[1]) for real_key in data.groups
+    }
+    summary_keys = ensemble.get_summary_keyset()
+    summary = ensemble.load_responses("summary", tuple(indices.values()))
     for real_key, var in data.groups.items():
-        index = int(re.match(r"REAL_(\d+)", real_key)[1])
+        index = indices[real_key]
 
         # Sanity check: Test data only contains GEN_KW, GEN_DATA and SUMMARY
         assert set(var.groups) == {"GEN_KW", "GEN_DATA", "SUMMARY"}
 
         # Compare SUMMARYs
-        for key in ensemble.get_summary_keyset():
-            expect = np.array(var["SUMMARY"][key])[1:]  # Skip first report_step
-            actual = (
-                ensemble.load_responses("summary", (index,))
-                .sel(name=key)["values"]
-                .data.flatten()
-            )
-            assert list(expect) == list(actual), key
+        real_summary = summary.sel(realization=index)
+        summary_group = var["SUMMARY"]
+        for key in summary_keys:
+            expect = np.array(summary_group[key])[1:]  # Skip first report_step
+            actual = real_summary.sel(name=key)["values"].data.flatten()
+            np.testing.assert_array_equal(expect, actual, err_msg=key)
 
         # Compare GEN_KWs
         for param in ens_config.parameters:
@@ -179,10 +185,11 @@ def test_migrate_case(data, storage, tmp_path, enspath, ens_config, name, iter):
             assert (expect_array == actual).all(), param
 
         # Compare GEN_DATAs
-        for key in set(var["GEN_DATA"].variables) - set(var["GEN_DATA"].dimensions):
-            expect = np.array(var["GEN_DATA"][key]).flatten()
+        gen_data_group = var["GEN_DATA"]
+        for key in set(gen_data_group.variables) - set(gen_data_group.dimensions):
+            expect = np.array(gen_data_group[key]).flatten()
             actual = ensemble.load_responses(key, (index,))["values"].data.flatten()
-            assert list(expect) == list(actual), key
+            np.testing.assert_array_equal(expect, actual, err_msg=key)
 
 
 def test_migration_failure(storage, enspath, ens_config, caplog, monkeypatch):
@@ -31,6 +31,7 @@
 from ert.config.general_observation import GenObservation
 from ert.config.observation_vector import ObsVector
 from ert.config.observations import EnkfObs
+from ert.shared.feature_toggling import FeatureDowncastFields
 from ert.storage import open_storage
 from ert.storage.local_storage import _LOCAL_STORAGE_VERSION
 from ert.storage.mode import ModeError
@@ -43,6 +44,30 @@ def _ensembles(storage):
     return sorted(x.name for x in storage.ensembles)
 
 
+@pytest.fixture
+def uniform_parameter():
+    return GenKwConfig(
+        name="PARAMETER",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+
+
+def _uniform_parameter_dataset(value: float) -> xr.Dataset:
+    return xr.Dataset(
+        {
+            "values": ("names", [value]),
+            "transformed_values": ("names", [value]),
+            "names": ["KEY1"],
+        }
+    )
+
+
 def test_create_experiment(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment(name="test-experiment")
@@ -163,6 +188,183 @@ def test_that_loading_parameter_via_response_api_fails(tmp_path):
             prior.load_responses("PARAMETER", (0,))
 
 
+def test_that_bulk_saved_parameters_are_written_to_combined_dataset(
+    tmp_path, caplog, uniform_parameter
+):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[uniform_parameter])
+        prior = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+
+        prior.save_parameters_bulk(
+            "PARAMETER",
+            xr.Dataset(
+                {
+                    "values": (("realizations", "names"), [[1.0], [2.0]]),
+                    "transformed_values": (("realizations", "names"), [[1.0], [2.0]]),
+                    "names": ["KEY1"],
+                    "realizations": [0, 2],
+                }
+            ),
+        )
+
+        assert prior.has_combined_parameter_dataset("PARAMETER")
+        assert not list(prior.mount_point.glob("realization-*/PARAMETER.nc"))
+        assert "Use 'float32' to save memory" not in caplog.text
+        assert prior.load_parameters("PARAMETER", 2)["values"].values.tolist() == [2.0]
+        assert prior.get_realization_mask_with_parameters().tolist() == [
+            True,
+            False,
+            True,
+        ]
+
+        with pytest.raises(ValueError, match="must have a 'realizations' dimension"):
+            prior.save_parameters_bulk(
+                "PARAMETER",
+                xr.Dataset({"values": ("names", [1.0]), "names": ["KEY1"]}),
+            )
+
+
+def test_that_combined_parameters_are_unaffected_by_rewriting_the_file(
+    tmp_path, uniform_parameter
+):
+    def bulk_dataset(values):
+        return xr.Dataset(
+            {
+                "values": (("realizations", "names"), values),
+                "transformed_values": (("realizations", "names"), values),
+                "names": ["KEY1"],
+                "realizations": [0, 1],
+            }
+        )
+
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[uniform_parameter])
+        prior = storage.create_ensemble(experiment, ensemble_size=2, name="prior")
+        prior.save_parameters_bulk("PARAMETER", bulk_dataset([[1.0], [2.0]]))
+        before = prior._load_combined_parameter_dataset("PARAMETER").sel(realizations=1)
+
+        prior.save_parameters_bulk("PARAMETER", bulk_dataset([[10.0], [20.0]]))
+
+        assert before["values"].values.tolist() == [2.0]
+        after = prior._load_combined_parameter_dataset("PARAMETER")
+        assert after.sel(realizations=1)["values"].values.tolist() == [20.0]
+
+
+def test_that_batch_saved_parameters_can_be_loaded(tmp_path, uniform_parameter):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[uniform_parameter])
+        prior = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+
+        prior.save_parameters_batch(
+            "PARAMETER",
+            (
+                (realization, _uniform_parameter_dataset(float(realization)))
+                for realization in (0, 2)
+            ),
+        )
+
+        assert prior.get_realization_mask_with_parameters().tolist() == [
+            True,
+            False,
+            True,
+        ]
+        for realization in (0, 2):
+            loaded = prior.load_parameters("PARAMETER", realization)
+            assert loaded["values"].values.tolist() == [float(realization)]
+
+
+def test_that_realizations_with_parameters_or_responses_are_initialized(
+    tmp_path, uniform_parameter
+):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[uniform_parameter],
+            responses=[GenDataConfig(name="RESPONSE")],
+        )
+        prior = storage.create_ensemble(experiment, ensemble_size=3, name="prior")
+        prior.save_parameters("PARAMETER", 0, _uniform_parameter_dataset(1.0))
+        prior.save_response(
+            "RESPONSE",
+            xr.Dataset(
+                {"values": (["report_step", "index"], [[1.0]])},
+                coords={"index": [0], "report_step": [0]},
+            ),
+            1,
+        )
+
+        assert prior.realizations_initialized([0, 1])
+        assert not prior.realizations_initialized([0, 2])
+        assert not prior.realizations_initialized([2])
+
+        prior.unify_parameters()
+        prior.unify_responses()
+        assert prior.realizations_initialized([0, 1])
+        assert not prior.realizations_initialized([1, 2])
+
+
+def test_that_ensemble_datasets_are_written_as_netcdf3(tmp_path, uniform_parameter):
+    # Storage version 6 is read with engine="scipy", which only reads NetCDF3
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[uniform_parameter])
+        prior = storage.create_ensemble(experiment, ensemble_size=2, name="prior")
+        for realization in range(2):
+            prior.save_parameters(
+                "PARAMETER", realization, _uniform_parameter_dataset(float(realization))
+            )
+        prior.save_response(
+            "RESPONSE",
+            xr.Dataset(
+                {"values": (["report_step", "index"], [[1.0, 2.0]])},
+                coords={"index": [0, 1], "report_step": [0]},
+            ),
+            0,
+        )
+        prior.unify_parameters()
+
+        paths = list(prior.mount_point.rglob("*.nc"))
+        assert {p.name for p in paths} == {"PARAMETER.nc", "RESPONSE.nc"}
+        for path in paths:
+            assert path.read_bytes()[:3] == b"CDF"
+            xr.open_dataset(path, engine="scipy").close()
+
+
+@pytest.mark.parametrize("downcast", [False, True])
+def test_that_fields_are_downcast_when_requested(
+    tmp_path, monkeypatch, caplog, downcast
+):
+    monkeypatch.setattr(FeatureDowncastFields, "_value", downcast)
+    surface = SurfaceConfig(
+        "SURFACE",
+        forward_init=False,
+        ncol=2,
+        nrow=3,
+        xori=0.0,
+        yori=0.0,
+        xinc=1.0,
+        yinc=1.0,
+        rotation=0.0,
+        yflip=1,
+        forward_init_file="input_%d",
+        output_file=tmp_path / "output",
+        base_surface_path="base_surface",
+        update=True,
+    )
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(parameters=[surface])
+        prior = storage.create_ensemble(experiment, ensemble_size=1, name="prior")
+
+        prior.save_parameters(
+            "SURFACE",
+            0,
+            xr.Dataset({"values": (("x", "y"), np.ones((2, 3), dtype=np.float64))}),
+        )
+
+        assert prior.load_parameters("SURFACE", 0)["values"].dtype == (
+            np.float32 if downcast else np.float64
+        )
+        assert ("Use 'float32' to save memory" in caplog.text) is not downcast
+
+
 def test_that_load_responses_throws_exception(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment()
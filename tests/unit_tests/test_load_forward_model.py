@@ -2,9 +2,11 @@
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent
+from typing import List
 
 import numpy as np
 import pytest
+import xarray as xr
 from resdata.summary import Summary
 
 from ert.config import ErtConfig
@@ -13,6 +15,11 @@
 from ert.storage import open_storage
 
 
+def _active_values(responses: xr.Dataset) -> List[float]:
+    values = responses["values"].values.ravel()
+    return values[~np.isnan(values)].tolist()
+
+
 @pytest.fixture()
 def setup_case(storage, use_tmpdir):
     def func(config_text):
@@ -51,11 +58,11 @@ def run_simulator(time_step_count, start_date) -> Summary:
     summary.add_variable("WOPRH", wgname="OP1", unit="SM3/DAY")
 
     mini_step_count = 10
+    add_t_step = summary.add_t_step
     for report_step in range(time_step_count):
-        for mini_step in range(mini_step_count):
-            t_step = summary.add_t_step(
-                report_step + 1, sim_days=report_step * mini_step_count + mini_step
-            )
+        first_day = report_step * mini_step_count
+        for sim_days in range(first_day, first_day + mini_step_count):
+            t_step = add_t_step(report_step + 1, sim_days=sim_days)
             t_step["FOPR"] = 1
             t_step["WOPR:OP1"] = 2
             t_step["FOPRH"] = 3
@@ -72,7 +79,7 @@ def test_load_forward_model(snake_oil_default_storage):
     facade = LibresFacade.from_config_file("snake_oil.ert")
     realisation_number = 0
 
-    realizations = [False] * facade.get_ensemble_size()
+    realizations = np.zeros(facade.get_ensemble_size(), dtype=bool)
     realizations[realisation_number] = True
 
     with open_storage(facade.enspath, mode="w") as storage:
@@ -162,22 +169,15 @@ def test_load_forward_model_gen_data(setup_case):
 
     config, prior_ensemble = setup_case(config_text)
     run_path = Path("simulations/realization-0/iter-0/")
-    with open(run_path / "response_0.out", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1", "2", "3"]))
-    with open(run_path / "response_1.out", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["4", "5", "5"]))
-    with open(run_path / "response_0.out_active", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1", "0", "1"]))
+    (run_path / "response_0.out").write_bytes(b"1\n2\n3")
+    (run_path / "response_1.out").write_bytes(b"4\n5\n5")
+    (run_path / "response_0.out_active").write_bytes(b"1\n0\n1")
 
     facade = LibresFacade(config)
     facade.load_from_forward_model(prior_ensemble, [True], 0)
     prior_ensemble.unify_responses()
-    assert list(
-        prior_ensemble.load_responses("RESPONSE", (0,))
-        .sel(report_step=0, drop=True)
-        .to_dataframe()
-        .dropna()
-        .values.flatten()
+    assert _active_values(
+        prior_ensemble.load_responses("RESPONSE", (0,)).sel(report_step=0)
     ) == [1.0, 3.0]
 
 
@@ -191,17 +191,13 @@ def test_single_valued_gen_data_with_active_info_is_loaded(setup_case):
     config, prior_ensemble = setup_case(config_text)
 
     run_path = Path("simulations/realization-0/iter-0/")
-    with open(run_path / "response_0.out", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1"]))
-    with open(run_path / "response_0.out_active", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1"]))
+    (run_path / "response_0.out").write_bytes(b"1")
+    (run_path / "response_0.out_active").write_bytes(b"1")
 
     facade = LibresFacade(config)
     facade.load_from_forward_model(prior_ensemble, [True], 0)
     prior_ensemble.unify_responses()
-    assert list(
-        prior_ensemble.load_responses("RESPONSE", (0,)).to_dataframe().values.flatten()
-    ) == [1.0]
+    assert _active_values(prior_ensemble.load_responses("RESPONSE", (0,))) == [1.0]
 
 
 def test_that_all_deactivated_values_are_loaded(setup_case):
@@ -214,17 +210,13 @@ def test_that_all_deactivated_values_are_loaded(setup_case):
     config, prior_ensemble = setup_case(config_text)
 
     run_path = Path("simulations/realization-0/iter-0/")
-    with open(run_path / "response_0.out", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["-1"]))
-    with open(run_path / "response_0.out_active", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["0"]))
+    (run_path / "response_0.out").write_bytes(b"-1")
+    (run_path / "response_0.out_active").write_bytes(b"0")
 
     facade = LibresFacade(config)
     facade.load_from_forward_model(prior_ensemble, [True], 0)
     prior_ensemble.unify_responses()
-    response = (
-        prior_ensemble.load_responses("RESPONSE", (0,)).to_dataframe().values.flatten()
-    )
+    response = prior_ensemble.load_responses("RESPONSE", (0,))["values"].values.ravel()
     assert np.isnan(response[0])
     assert len(response) == 1
 
@@ -259,20 +251,14 @@ def test_loading_gen_data_without_restart(storage):
     )
     create_run_path(run_context, ert_config)
     run_path = Path("simulations/realization-0/iter-0/")
-    with open(run_path / "response.out", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1", "2", "3"]))
-    with open(run_path / "response.out_active", "w", encoding="utf-8") as fout:
-        fout.write("\n".join(["1", "0", "1"]))
+    (run_path / "response.out").write_bytes(b"1\n2\n3")
+    (run_path / "response.out_active").write_bytes(b"1\n0\n1")
 
     facade = LibresFacade.from_config_file("config.ert")
     facade.load_from_forward_model(prior_ensemble, [True], 0)
     prior_ensemble.unify_responses()
-    assert list(
-        prior_ensemble.load_responses("RESPONSE", (0,))
-        .to_dataframe()
-        .dropna()
-        .values.flatten()
-    ) == [1.0, 3.0]
+    responses = prior_ensemble.load_responses("RESPONSE", (0,))
+    assert _active_values(responses) == [1.0, 3.0]
 
 
 @pytest.mark.usefixtures("copy_snake_oil_case_storage")
@@ -285,7 +271,7 @@ def test_that_the_states_are_set_correctly():
     storage = open_storage(facade.enspath, mode="w")
     ensemble = storage.get_ensemble_by_name("default_0")
     ensemble_size = facade.get_ensemble_size()
-    realizations = np.array([True] * ensemble_size)
+    realizations = np.ones(ensemble_size, dtype=bool)
 
     new_ensemble = storage.create_ensemble(
         experiment=ensemble.experiment, ensemble_size=ensemble_size
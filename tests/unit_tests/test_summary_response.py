@@ -1,10 +1,10 @@
-import shutil
 from pathlib import Path
 from textwrap import dedent
 
 from ert import LibresFacade
 from ert.config import ErtConfig
 from ert.enkf_main import create_run_path, ensemble_context
+from tests.utils import link_or_copy
 
 
 def test_load_summary_response_restart_not_zero(tmpdir, snapshot, request, storage):
@@ -47,8 +47,9 @@ def test_load_summary_response_restart_not_zero(tmpdir, snapshot, request, stora
         )
 
         create_run_path(prior, ert_config)
-        shutil.copy(test_path / "PRED_RUN.SMSPEC", sim_path / "PRED_RUN.SMSPEC")
-        shutil.copy(test_path / "PRED_RUN.UNSMRY", sim_path / "PRED_RUN.UNSMRY")
+        # resdata only reads the summary files, so hard links will do
+        link_or_copy(test_path / "PRED_RUN.SMSPEC", sim_path / "PRED_RUN.SMSPEC")
+        link_or_copy(test_path / "PRED_RUN.UNSMRY", sim_path / "PRED_RUN.UNSMRY")
 
         facade = LibresFacade.from_config_file("config.ert")
         facade.load_from_forward_model(ensemble, [True], 0)
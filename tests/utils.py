@@ -2,6 +2,8 @@
 
 import asyncio
 import contextlib
+import os
+import shutil
 import time
 from functools import partial
 from pathlib import Path
@@ -35,6 +37,17 @@ def source_dir() -> Path:
 SOURCE_DIR: Path = source_dir()
 
 
+def link_or_copy(source, destination) -> None:
+    """Hard links source to destination, copying when linking is not possible.
+
+    Only suitable for files the test reads, as writes go to the source file.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
 def wait_until(func, interval=0.5, timeout=30):
     """Waits until func returns True.
 